@@ -15,6 +15,7 @@ from typing import Dict, List, Any, Optional
 from flask import jsonify, request, send_file
 from flask_jwt_extended import jwt_required
 from datetime import datetime
+from dataclasses import asdict
 
 # Import FootballViz components
 from footballviz import FootballTheme, ThemeManager, CHART_TEMPLATES
@@ -224,7 +225,7 @@ class FootballVizAPI:
                 'chart_image': chart_base64,
                 'chart_config': chart_config,
                 'processed_data': {
-                    'summary': processed_data['summary'].__dict__ if processed_data.get('summary') else {},
+                    'summary': asdict(processed_data['summary']) if processed_data.get('summary') else {},
                     'formations_count': len(processed_data.get('formations', {})),
                     'play_types_count': len(processed_data.get('play_types', {}))
                 }
@@ -380,7 +381,7 @@ class FootballVizAPI:
             processed_data = self.data_processor.process_play_data(play_data)
             
             # Convert summary to dict for JSON serialization
-            summary_dict = processed_data['summary'].__dict__ if processed_data.get('summary') else {}
+            summary_dict = asdict(processed_data['summary']) if processed_data.get('summary') else {}
             
             return jsonify({
                 'game_info': {
@@ -393,7 +394,8 @@ class FootballVizAPI:
                 'formations': processed_data.get('formations', {}),
                 'play_types': processed_data.get('play_types', {}),
                 'down_distance': processed_data.get('down_distance', {}),
-                'situational': processed_data.get('situational', {}),
+                # Empty situations share a read-only mapping; copy for JSON
+                'situational': {name: dict(stats) for name, stats in processed_data.get('situational', {}).items()},
                 'available_charts': list(CHART_TEMPLATES.keys())
             }), 200
             
@@ -8,6 +8,7 @@ import json
 import logging
 from datetime import datetime
 from dataclasses import dataclass, asdict
+from functools import cached_property
 from enum import Enum
 
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
@@ -740,9 +741,14 @@ Down Distribution: {downs}"""
                         recommendations.append(line)
         return recommendations
     
-    def get_available_workflows(self) -> Dict[str, List[str]]:
-        """Get available predefined workflows"""
+    @cached_property
+    def available_workflows(self) -> Dict[str, List[str]]:
+        """Step summaries per predefined workflow, built once per pipeline"""
         workflows = {}
         for name, steps in self.workflows.items():
             workflows[name] = [f"{step.step_id}: {step.description}" for step in steps]
-        return workflows
\ No newline at end of file
+        return workflows
+    
+    def get_available_workflows(self) -> Dict[str, List[str]]:
+        """Get available predefined workflows"""
+        return self.available_workflows
\ No newline at end of file
@@ -8,6 +8,7 @@ import json
 import logging
 from datetime import datetime
 
+from cachetools import TTLCache
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.output_parsers import StrOutputParser, JsonOutputParser
@@ -40,6 +41,10 @@ class FootballAnalyticsCallbackHandler(BaseCallbackHandler):
         })
 
 
+# Seconds an is_available() probe result is reused before Ollama is asked again
+AVAILABILITY_TTL_SECONDS = 5
+
+
 class FootballLangChainService:
     """Enhanced AI service using LangChain for football analytics"""
     
@@ -48,6 +53,9 @@ class FootballLangChainService:
         self.model = model
         self.callback_handler = FootballAnalyticsCallbackHandler()
         
+        # Last availability probe result, dropped after AVAILABILITY_TTL_SECONDS
+        self._availability: TTLCache = TTLCache(maxsize=1, ttl=AVAILABILITY_TTL_SECONDS)
+        
         # Initialize Ollama LLM
         self.llm = OllamaLLM(
             base_url=base_url,
@@ -152,12 +160,18 @@ Analyze the current data in context of previous findings and provide insights fo
         ])
     
     def is_available(self) -> bool:
-        """Check if the LangChain service is available"""
+        """Check if the LangChain service is available, reusing a probe from the last few seconds"""
+        available = self._availability.get('available')
+        if available is not None:
+            return available
+        
         try:
             test_response = self.llm.invoke("test")
-            return bool(test_response)
+            available = bool(test_response)
         except Exception:
-            return False
+            available = False
+        self._availability['available'] = available
+        return available
     
     def natural_language_to_sql(self, query: str) -> Dict[str, Any]:
         """Convert natural language query to SQL filter conditions"""
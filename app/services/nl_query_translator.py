@@ -8,6 +8,7 @@ import json
 import logging
 import re
 from dataclasses import dataclass
+from functools import cached_property
 
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser, StrOutputParser
@@ -95,8 +96,7 @@ class FootballQueryTranslator:
         """Setup LangChain prompt templates for query translation"""
         
         # Primary translation template
-        self.translation_template = ChatPromptTemplate.from_messages([
-            ("system", """You are a football analytics expert. Convert natural language queries about football data into structured JSON filters.
+        translation_system_prompt = """You are a football analytics expert. Convert natural language queries about football data into structured JSON filters.
 
 AVAILABLE FIELDS & OPERATORS:
 - down: integer (1-4) | equals, not_equals, greater_than, less_than, in
@@ -132,10 +132,18 @@ IMPORTANT:
 - Only use fields and operators listed above
 - Use "and" logic unless query explicitly mentions "or"
 - Set confidence 0.0-1.0 based on query clarity
-- If unsure, use most likely interpretation"""),
+- If unsure, use most likely interpretation"""
+        self.translation_template = ChatPromptTemplate.from_messages([
+            ("system", translation_system_prompt),
             ("user", "Query: {query}")
         ])
         
+        # Several queries answered in one LLM round-trip
+        self.batch_translation_template = ChatPromptTemplate.from_messages([
+            ("system", translation_system_prompt),
+            ("user", "Queries:\n{queries}\n\nReturn a JSON array where element i is the filter object for query i.")
+        ])
+        
         # Validation template
         self.validation_template = ChatPromptTemplate.from_messages([
             ("system", """Validate and correct this football query filter if needed.
@@ -178,6 +186,40 @@ If corrections needed, provide improved version. Otherwise, return original.""")
                 suggested_corrections=self._suggest_corrections(query)
             )
     
+    def translate_queries_batch(self, queries: List[str]) -> List[QueryTranslationResult]:
+        """Translate several queries, sending all that need the LLM in a single prompt"""
+        results: List[Optional[QueryTranslationResult]] = [None] * len(queries)
+        pending = []
+        
+        for i, query in enumerate(queries):
+            pattern_result = self._check_common_patterns(self._preprocess_query(query))
+            if pattern_result:
+                results[i] = pattern_result
+            else:
+                pending.append(i)
+        
+        if pending:
+            batch_filters = None
+            try:
+                chain = self.batch_translation_template | self.llm | JsonOutputParser()
+                numbered = "\n".join(f"{n}. {self._preprocess_query(queries[i])}" for n, i in enumerate(pending, 1))
+                batch_filters = chain.invoke({"queries": numbered})
+            except Exception as e:
+                logging.error(f"Batch LLM translation error: {str(e)}")
+            
+            if isinstance(batch_filters, list) and len(batch_filters) == len(pending):
+                for i, filters in zip(pending, batch_filters):
+                    try:
+                        results[i] = self._validate_translation(self._result_from_llm_filters(filters), queries[i])
+                    except Exception:
+                        results[i] = self.translate_query(queries[i])
+            else:
+                # Unusable batch answer: fall back to one round-trip per query
+                for i in pending:
+                    results[i] = self.translate_query(queries[i])
+        
+        return results
+    
     def _preprocess_query(self, query: str) -> str:
         """Clean and normalize the query"""
         # Convert to lowercase
@@ -252,19 +294,7 @@ If corrections needed, provide improved version. Otherwise, return original.""")
         try:
             chain = self.translation_template | self.llm | JsonOutputParser()
             result = chain.invoke({"query": query})
-            
-            # Validate LLM response structure
-            if not isinstance(result, dict) or "conditions" not in result:
-                raise ValueError("Invalid LLM response structure")
-            
-            sql_conditions = self._convert_to_sql_conditions(result["conditions"])
-            
-            return QueryTranslationResult(
-                success=True,
-                filters=result,
-                sql_conditions=sql_conditions,
-                confidence_score=result.get("confidence", 0.5)
-            )
+            return self._result_from_llm_filters(result)
             
         except Exception as e:
             logging.error(f"LLM translation error: {str(e)}")
@@ -273,6 +303,21 @@ If corrections needed, provide improved version. Otherwise, return original.""")
                 error_message=f"LLM translation failed: {str(e)}"
             )
     
+    def _result_from_llm_filters(self, result: Any) -> QueryTranslationResult:
+        """Build a translation result from one LLM filter object"""
+        # Validate LLM response structure
+        if not isinstance(result, dict) or "conditions" not in result:
+            raise ValueError("Invalid LLM response structure")
+        
+        sql_conditions = self._convert_to_sql_conditions(result["conditions"])
+        
+        return QueryTranslationResult(
+            success=True,
+            filters=result,
+            sql_conditions=sql_conditions,
+            confidence_score=result.get("confidence", 0.5)
+        )
+    
     def _validate_translation(self, result: QueryTranslationResult, original_query: str) -> QueryTranslationResult:
         """Validate and potentially correct the translation"""
         if not result.filters or not result.filters.get("conditions"):
@@ -367,8 +412,9 @@ If corrections needed, provide improved version. Otherwise, return original.""")
         
         return suggestions
     
-    def get_query_examples(self) -> Dict[str, str]:
-        """Get example queries for documentation"""
+    @cached_property
+    def query_examples(self) -> Dict[str, str]:
+        """Example queries for documentation, built once per translator"""
         return {
             "Red zone plays": "Shows plays inside the 20-yard line",
             "Third down conversions": "Shows all third down attempts", 
@@ -380,6 +426,10 @@ If corrections needed, provide improved version. Otherwise, return original.""")
             "Goal line plays": "Shows plays inside the 5-yard line"
         }
     
+    def get_query_examples(self) -> Dict[str, str]:
+        """Get example queries for documentation"""
+        return self.query_examples
+    
     def analyze_query_difficulty(self, query: str) -> Dict[str, Any]:
         """Analyze how difficult a query is to translate"""
         words = query.lower().split()
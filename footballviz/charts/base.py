@@ -14,12 +14,13 @@ from typing import Dict, List, Any, Optional, Tuple, Union
 from abc import ABC, abstractmethod
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-import numpy as np
 from datetime import datetime
 
 from ..core.theme import FootballTheme, theme_manager
 from ..core.colors import PerformanceColors
 
+_EXPORT_BUFFER_SIZE = 1 << 20
+
 
 class FootballChart(ABC):
     """
@@ -403,6 +404,49 @@ class ChartExporter:
         
         return filename
     
+    @classmethod
+    def export_chart_formats(cls,
+                            chart: FootballChart,
+                            base_filename: str,
+                            formats: List[str],
+                            preset: str = 'web') -> List[str]:
+        """
+        Export one rendered chart in several formats with a preset's save settings
+        
+        Args:
+            chart: FootballChart instance
+            base_filename: Output filename without extension
+            formats: List of formats to export
+            preset: Export preset name
+            
+        Returns:
+            List of exported filenames, in ``formats`` order
+        """
+        if preset not in cls.EXPORT_PRESETS:
+            preset = 'web'
+        
+        settings = cls.EXPORT_PRESETS[preset]
+        
+        # The preset's font_scale is not applied: the figure is already drawn, so
+        # rescaling fonts here changes no text, and charts share the theme's
+        # FontManager, so concurrent scale/unscale would corrupt its sizes
+        export_kwargs = {
+            'dpi': settings['dpi'],
+            'bbox_inches': 'tight',
+            'facecolor': chart.theme.config.background_color,
+            'edgecolor': 'none'
+        }
+        
+        exported_files = []
+        for format_name in formats:
+            filename = f"{base_filename}.{format_name}"
+            # Large buffer so PDF/SVG backends' many small writes reach the disk in few syscalls
+            with open(filename, 'wb', buffering=_EXPORT_BUFFER_SIZE) as output_file:
+                chart.save(output_file, format=format_name, **export_kwargs)
+            exported_files.append(filename)
+        
+        return exported_files
+    
     @classmethod
     def get_preset_info(cls) -> Dict[str, str]:
         """Get information about available export presets"""
@@ -8,7 +8,6 @@ Specialized line chart implementations for football analytics:
 """
 
 from typing import Dict, List, Any, Optional
-import numpy as np
 import matplotlib.pyplot as plt
 
 from .base import FootballChart
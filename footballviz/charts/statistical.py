@@ -13,7 +13,7 @@ import numpy as np
 import pandas as pd
 import io
 import base64
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from scipy import stats
 import seaborn as sns
 from .base import FootballChart
@@ -57,9 +57,13 @@ class StatisticalChart(FootballChart):
         ax.axis('off')
         return self._save_chart(fig)
     
-    def _prepare_dataframe(self, plays_data: List[Dict[str, Any]]) -> pd.DataFrame:
+    def _prepare_dataframe(self, plays_data: Union[List[Dict[str, Any]], pd.DataFrame]) -> pd.DataFrame:
         """Convert plays data to pandas DataFrame for statistical analysis"""
-        df = pd.DataFrame(plays_data)
+        if isinstance(plays_data, pd.DataFrame):
+            # Shallow copy: shares the caller's columns, derived columns stay local
+            df = plays_data.copy(deep=False)
+        else:
+            df = pd.DataFrame(plays_data)
         
         # Add derived columns for analysis
         if 'yards_gained' in df.columns:
@@ -429,9 +433,9 @@ class FootballHeatmap(StatisticalChart):
         return self._save_chart(fig)
 
 # Chart factory function
-def create_statistical_chart(chart_type: str, plays_data: List[Dict[str, Any]], 
+def create_statistical_chart(chart_type: str, plays_data: Union[List[Dict[str, Any]], pd.DataFrame], 
                            **kwargs) -> str:
-    """Factory function to create statistical charts"""
+    """Factory function to create statistical charts from play dicts or a prebuilt DataFrame"""
     
     if chart_type == 'distribution':
         chart = DistributionChart()
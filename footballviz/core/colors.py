@@ -9,6 +9,7 @@ Professional color schemes designed for football analytics:
 
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
+import numpy as np
 import matplotlib.colors as mcolors
 
 
@@ -52,6 +53,21 @@ class PerformanceColors:
         else:
             return cls.CONCERN
     
+    @classmethod
+    def get_performance_colors(cls, percentiles) -> np.ndarray:
+        """
+        Vectorized get_performance_color for a sequence of percentiles
+        
+        Args:
+            percentiles: Sequence or array of performance percentiles (0-100)
+            
+        Returns:
+            Array of hex color strings, one per percentile
+        """
+        # Tier bounds are whole numbers, so truncating to an int index is exact
+        values = np.nan_to_num(np.asarray(percentiles, dtype=float), nan=0.0)
+        return _PERFORMANCE_LUT[np.clip(values, 0, 100).astype(np.intp)]
+    
     @classmethod
     def get_gradient_colors(cls, n_colors: int = 5) -> List[str]:
         """Generate gradient colors from concern to elite"""
@@ -64,6 +80,10 @@ class PerformanceColors:
         return mcolors.LinearSegmentedColormap.from_list(name, colors)
 
 
+# Performance color for every whole percentile 0-100, used by get_performance_colors
+_PERFORMANCE_LUT = np.array([PerformanceColors.get_performance_color(p) for p in range(101)])
+
+
 @dataclass
 class TeamColors:
     """Team color integration system"""
@@ -7,7 +7,8 @@ Professional font specifications optimized for coaching staff readability:
 - Weight and style management
 """
 
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
@@ -48,6 +49,7 @@ class FontManager:
         """
         self.output_format = output_format
         self.base_size = self._get_base_size()
+        self._text_properties_cache: Dict[Tuple[str, str], Mapping[str, Any]] = {}
         self._setup_fonts()
     
     def _get_base_size(self) -> int:
@@ -168,7 +170,7 @@ class FontManager:
             legend_font.update(kwargs.get('legend', {}))
             ax.legend(prop=legend_font)
     
-    def get_text_properties(self, element_type: str, color: str = '#FFFFFF') -> Dict[str, Any]:
+    def get_text_properties(self, element_type: str, color: str = '#FFFFFF') -> Mapping[str, Any]:
         """
         Get complete text properties including color
         
@@ -177,10 +179,14 @@ class FontManager:
             color: Text color
             
         Returns:
-            Complete text properties dictionary
+            Read-only text properties mapping, shared between callers
         """
-        props = self.get_font(element_type)
-        props['color'] = color
+        key = (element_type, color)
+        props = self._text_properties_cache.get(key)
+        if props is None:
+            font = self.get_font(element_type)
+            font['color'] = color
+            props = self._text_properties_cache[key] = MappingProxyType(font)
         return props
     
     @staticmethod
@@ -207,6 +213,7 @@ class FontManager:
         """
         for spec in self.specifications.values():
             spec.size = int(spec.size * scale_factor)
+        self._text_properties_cache.clear()
 
 
 # Pre-defined font configurations for different contexts
@@ -125,50 +125,62 @@ class FootballTheme:
             fig: Matplotlib figure
             ax: Matplotlib axes (if None, applies to all axes)
         """
-        # Figure styling
-        fig.patch.set_facecolor(self.config.figure_facecolor)
-        
         # Apply to all axes if none specified
-        axes_list = [ax] if ax else fig.get_axes()
-        
-        for axis in axes_list:
-            self._apply_to_axes(axis)
+        self.apply_to_axes(fig, [ax] if ax else fig.get_axes())
     
-    def _apply_to_axes(self, ax):
-        """Apply theme styling to specific axes"""
-        
-        # Axes background
-        ax.set_facecolor(self.config.axes_facecolor)
-        
-        # Grid styling
-        ax.grid(True, 
-                color=self.config.grid_color,
-                alpha=self.config.grid_alpha,
-                linestyle=self.config.grid_style,
-                linewidth=self.config.grid_width)
-        ax.set_axisbelow(True)  # Grid behind data
+    def apply_to_axes(self, fig, axes):
+        """
+        Apply theme to a figure and a batch of its axes
         
-        # Spine styling
-        for spine_name, spine in ax.spines.items():
-            if spine_name in ['top', 'right'] and not getattr(self.config, f'show_{spine_name}_spine'):
-                spine.set_visible(False)
-            else:
-                spine.set_color(self.config.spine_color)
-                spine.set_alpha(self.config.spine_alpha)
-                spine.set_linewidth(self.config.spine_width)
+        Args:
+            fig: Matplotlib figure
+            axes: Iterable of matplotlib axes to style
+        """
+        config = self.config
         
-        # Tick styling
-        ax.tick_params(colors=self.config.primary_text_color,
-                      which='both',
-                      direction='out',
-                      length=4,
-                      width=1)
+        # Figure styling
+        fig.patch.set_facecolor(config.figure_facecolor)
+        
+        # Styling shared by every axes, resolved once per batch
+        grid_style = {
+            'color': config.grid_color,
+            'alpha': config.grid_alpha,
+            'linestyle': config.grid_style,
+            'linewidth': config.grid_width
+        }
+        hidden_spines = {name for name in ('top', 'right')
+                         if not getattr(config, f'show_{name}_spine')}
+        font_overrides = {
+            'title': {'color': config.primary_text_color},
+            'xlabel': {'color': config.secondary_text_color},
+            'ylabel': {'color': config.secondary_text_color}
+        }
         
-        # Apply fonts
-        self.font_manager.apply_to_axes(ax, 
-                                       title={'color': self.config.primary_text_color},
-                                       xlabel={'color': self.config.secondary_text_color},
-                                       ylabel={'color': self.config.secondary_text_color})
+        for ax in axes:
+            # Axes background
+            ax.set_facecolor(config.axes_facecolor)
+            
+            # Grid styling
+            ax.grid(True, **grid_style)
+            ax.set_axisbelow(True)  # Grid behind data
+            
+            # Spine styling
+            for spine_name, spine in ax.spines.items():
+                if spine_name in hidden_spines:
+                    spine.set_visible(False)
+                else:
+                    spine.set(color=config.spine_color, alpha=config.spine_alpha,
+                              linewidth=config.spine_width)
+            
+            # Tick styling
+            ax.tick_params(colors=config.primary_text_color,
+                          which='both',
+                          direction='out',
+                          length=4,
+                          width=1)
+            
+            # Apply fonts
+            self.font_manager.apply_to_axes(ax, **font_overrides)
     
     def get_color_palette(self, palette_type: str = 'performance', n_colors: int = 5) -> list:
         """
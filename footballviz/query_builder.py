@@ -9,7 +9,7 @@ Dynamic SQL query generation service for complex football data analysis:
 
 from typing import Dict, List, Any, Optional, Union, Tuple
 from enum import Enum
-from sqlalchemy import and_, or_, not_, func, text
+from sqlalchemy import and_, or_, not_, func, text, inspect, case, select
 from sqlalchemy.orm.query import Query
 
 
@@ -31,6 +31,42 @@ class FilterOperator(Enum):
     IS_NOT_NULL = "is_not_null"
 
 
+# Operator -> clause factory taking (column, value)
+_OPERATOR_CLAUSES = {
+    FilterOperator.EQUALS: lambda field, value: field == value,
+    FilterOperator.NOT_EQUALS: lambda field, value: field != value,
+    FilterOperator.GREATER_THAN: lambda field, value: field > value,
+    FilterOperator.GREATER_THAN_OR_EQUAL: lambda field, value: field >= value,
+    FilterOperator.LESS_THAN: lambda field, value: field < value,
+    FilterOperator.LESS_THAN_OR_EQUAL: lambda field, value: field <= value,
+    FilterOperator.BETWEEN: lambda field, value: field.between(value[0], value[1]),
+    FilterOperator.IN: lambda field, value: field.in_(value),
+    FilterOperator.NOT_IN: lambda field, value: ~field.in_(value),
+    FilterOperator.CONTAINS: lambda field, value: field.contains(value),
+    FilterOperator.STARTS_WITH: lambda field, value: field.startswith(value),
+    FilterOperator.ENDS_WITH: lambda field, value: field.endswith(value),
+    FilterOperator.IS_NULL: lambda field, value: field.is_(None),
+    FilterOperator.IS_NOT_NULL: lambda field, value: field.isnot(None),
+}
+
+
+# Value shape each operator expects; anything not listed requires a value
+_VALUE_REQUIREMENTS = {
+    FilterOperator.IS_NULL: 'none',
+    FilterOperator.IS_NOT_NULL: 'none',
+    FilterOperator.BETWEEN: 'pair',
+    FilterOperator.IN: 'list',
+    FilterOperator.NOT_IN: 'list',
+}
+
+
+# Columns returned for each play by CustomQueryBuilder.execute_query
+_RESULT_FIELDS = (
+    'id', 'game_id', 'play_id', 'down', 'distance', 'yard_line',
+    'formation', 'play_type', 'play_name', 'result_of_play', 'yards_gained'
+)
+
+
 class LogicOperator(Enum):
     """Logical operators for combining conditions"""
     AND = "and"
@@ -38,28 +74,37 @@ class LogicOperator(Enum):
     NOT = "not"
 
 
+# Serialized value -> enum member, used when deserializing filter trees
+_FILTER_OPERATORS_BY_VALUE = {op.value: op for op in FilterOperator}
+_LOGIC_OPERATORS_BY_VALUE = {op.value: op for op in LogicOperator}
+
+
 class FilterCondition:
     """Individual filter condition"""
     
-    def __init__(self, field: str, operator: FilterOperator, value: Any = None):
+    __slots__ = ('field', 'operator', 'value')
+    
+    def __init__(self, field: str, operator: FilterOperator, value: Any = None) -> None:
         self.field = field
         self.operator = operator
         self.value = value
         self.validate()
     
-    def validate(self):
+    def validate(self) -> None:
         """Validate the filter condition"""
-        if self.operator in [FilterOperator.IS_NULL, FilterOperator.IS_NOT_NULL]:
+        requirement = _VALUE_REQUIREMENTS.get(self.operator, 'required')
+        
+        if requirement == 'required':
+            if self.value is None:
+                raise ValueError(f"Operator {self.operator.value} requires a value")
+        elif requirement == 'none':
             if self.value is not None:
                 raise ValueError(f"NULL operators should not have a value")
-        elif self.operator == FilterOperator.BETWEEN:
+        elif requirement == 'pair':
             if not isinstance(self.value, (list, tuple)) or len(self.value) != 2:
                 raise ValueError("BETWEEN operator requires a list/tuple of 2 values")
-        elif self.operator in [FilterOperator.IN, FilterOperator.NOT_IN]:
-            if not isinstance(self.value, (list, tuple)):
-                raise ValueError("IN/NOT_IN operators require a list/tuple of values")
-        elif self.value is None:
-            raise ValueError(f"Operator {self.operator.value} requires a value")
+        elif not isinstance(self.value, (list, tuple)):
+            raise ValueError("IN/NOT_IN operators require a list/tuple of values")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation"""
@@ -72,9 +117,14 @@ class FilterCondition:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'FilterCondition':
         """Create from dictionary representation"""
+        try:
+            operator = _FILTER_OPERATORS_BY_VALUE[data['operator']]
+        except (KeyError, TypeError):
+            raise ValueError(f"{data['operator']!r} is not a valid FilterOperator")
+        
         return cls(
             field=data['field'],
-            operator=FilterOperator(data['operator']),
+            operator=operator,
             value=data.get('value')
         )
 
@@ -82,19 +132,51 @@ class FilterCondition:
 class LogicGroup:
     """Group of filter conditions with logical operators"""
     
-    def __init__(self, operator: LogicOperator = LogicOperator.AND):
+    __slots__ = ('operator', 'conditions')
+    
+    def __init__(self, operator: LogicOperator = LogicOperator.AND) -> None:
         self.operator = operator
         self.conditions: List[Union[FilterCondition, 'LogicGroup']] = []
     
-    def add_condition(self, condition: Union[FilterCondition, 'LogicGroup']):
+    def add_condition(self, condition: Union[FilterCondition, 'LogicGroup']) -> None:
         """Add a condition or nested group"""
         self.conditions.append(condition)
     
-    def add_filter(self, field: str, operator: FilterOperator, value: Any = None):
+    def add_filter(self, field: str, operator: FilterOperator, value: Any = None) -> None:
         """Add a filter condition directly"""
         condition = FilterCondition(field, operator, value)
         self.add_condition(condition)
     
+    def build_clause(self, columns: Dict[str, Any]) -> Any:
+        """Build the WHERE clause for this group from a column name -> column mapping"""
+        if not self.conditions:
+            return True
+        
+        combine = _LOGIC_COMBINATORS.get(self.operator, _LOGIC_COMBINATORS[LogicOperator.AND])
+        return combine(self._child_clauses(columns))
+    
+    def _child_clauses(self, columns: Dict[str, Any]) -> List[Any]:
+        """
+        Build the group's child clauses as a flat list
+        
+        Nested AND/OR groups that share the group's operator are spliced into the
+        list instead of being wrapped in their own AND/OR; the group's conditions
+        are left untouched.
+        """
+        if not self.conditions:
+            return [True]
+        
+        clauses = []
+        for condition in self.conditions:
+            if isinstance(condition, FilterCondition):
+                clauses.append(_condition_clause(condition, columns))
+            elif isinstance(condition, LogicGroup):
+                if condition.operator == self.operator and self.operator != LogicOperator.NOT:
+                    clauses.extend(condition._child_clauses(columns))
+                else:
+                    clauses.append(condition.build_clause(columns))
+        return clauses
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation"""
         return {
@@ -108,9 +190,14 @@ class LogicGroup:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LogicGroup':
         """Create from dictionary representation"""
-        group = cls(LogicOperator(data['operator']))
+        try:
+            operator = _LOGIC_OPERATORS_BY_VALUE[data['operator']]
+        except (KeyError, TypeError):
+            raise ValueError(f"{data['operator']!r} is not a valid LogicOperator")
+        
+        group = cls(operator)
         for cond_data in data['conditions']:
-            if 'operator' in cond_data and cond_data['operator'] in ['and', 'or', 'not']:
+            if 'operator' in cond_data and cond_data['operator'] in _LOGIC_OPERATORS_BY_VALUE:
                 # It's a nested group
                 group.add_condition(cls.from_dict(cond_data))
             else:
@@ -119,97 +206,87 @@ class LogicGroup:
         return group
 
 
+# Logic operator -> combinator over the child clauses
+_LOGIC_COMBINATORS = {
+    LogicOperator.AND: lambda clauses: and_(*clauses),
+    LogicOperator.OR: lambda clauses: or_(*clauses),
+    LogicOperator.NOT: lambda clauses: not_(and_(*clauses)),
+}
+
+
+def _condition_clause(condition: FilterCondition, columns: Dict[str, Any]) -> Any:
+    """Build an individual condition clause"""
+    build = _OPERATOR_CLAUSES.get(condition.operator)
+    if build is None:
+        raise ValueError(f"Unsupported operator: {condition.operator}")
+    
+    column = columns.get(condition.field)
+    if column is None:
+        raise ValueError(f"Unknown field: {condition.field}")
+    return build(column, condition.value)
+
+
 class CustomQueryBuilder:
     """Main query builder service"""
     
-    def __init__(self, db_session, play_data_model):
+    def __init__(self, db_session, play_data_model) -> None:
         self.db_session = db_session
         self.play_data_model = play_data_model
         self.base_query = db_session.query(play_data_model)
+        
+        # Resolve mapped columns once; filters look fields up by name per condition
+        self._columns = {
+            attr.key: getattr(play_data_model, attr.key)
+            for attr in inspect(play_data_model).column_attrs
+        }
+        self._result_columns = [self._columns[name].label(name) for name in _RESULT_FIELDS]
+        
+        # Aggregate statement without WHERE; get_query_stats attaches criteria per call
+        self._stats_statement = select(
+            func.count(play_data_model.id),
+            func.avg(play_data_model.yards_gained),
+            func.coalesce(func.sum(case((play_data_model.yards_gained > 0, 1), else_=0)), 0)
+        ).select_from(play_data_model)
     
     def build_query(self, filter_group: LogicGroup, game_id: Optional[int] = None) -> Query:
         """Build SQLAlchemy query from filter group"""
-        query = self.base_query
+        criteria = self._build_criteria(filter_group, game_id)
+        return self.base_query.filter(*criteria) if criteria else self.base_query
+    
+    def _build_criteria(self, filter_group: LogicGroup, game_id: Optional[int] = None) -> List[Any]:
+        """Build the WHERE criteria shared by row queries and aggregates"""
+        criteria = []
         
         # Add game filter if specified
         if game_id:
-            query = query.filter(self.play_data_model.game_id == game_id)
+            criteria.append(self.play_data_model.game_id == game_id)
         
         # Apply custom filters
         if filter_group.conditions:
-            query = query.filter(self._build_where_clause(filter_group))
+            criteria.append(filter_group.build_clause(self._columns))
         
-        return query
-    
-    def _build_where_clause(self, group: LogicGroup):
-        """Build WHERE clause from logic group"""
-        if not group.conditions:
-            return True
-        
-        clauses = []
-        for condition in group.conditions:
-            if isinstance(condition, FilterCondition):
-                clauses.append(self._build_condition_clause(condition))
-            elif isinstance(condition, LogicGroup):
-                clauses.append(self._build_where_clause(condition))
-        
-        if group.operator == LogicOperator.AND:
-            return and_(*clauses)
-        elif group.operator == LogicOperator.OR:
-            return or_(*clauses)
-        elif group.operator == LogicOperator.NOT:
-            return not_(and_(*clauses))
-        
-        return and_(*clauses)  # Default to AND
-    
-    def _build_condition_clause(self, condition: FilterCondition):
-        """Build individual condition clause"""
-        field = getattr(self.play_data_model, condition.field)
-        
-        if condition.operator == FilterOperator.EQUALS:
-            return field == condition.value
-        elif condition.operator == FilterOperator.NOT_EQUALS:
-            return field != condition.value
-        elif condition.operator == FilterOperator.GREATER_THAN:
-            return field > condition.value
-        elif condition.operator == FilterOperator.GREATER_THAN_OR_EQUAL:
-            return field >= condition.value
-        elif condition.operator == FilterOperator.LESS_THAN:
-            return field < condition.value
-        elif condition.operator == FilterOperator.LESS_THAN_OR_EQUAL:
-            return field <= condition.value
-        elif condition.operator == FilterOperator.BETWEEN:
-            return field.between(condition.value[0], condition.value[1])
-        elif condition.operator == FilterOperator.IN:
-            return field.in_(condition.value)
-        elif condition.operator == FilterOperator.NOT_IN:
-            return ~field.in_(condition.value)
-        elif condition.operator == FilterOperator.CONTAINS:
-            return field.contains(condition.value)
-        elif condition.operator == FilterOperator.STARTS_WITH:
-            return field.startswith(condition.value)
-        elif condition.operator == FilterOperator.ENDS_WITH:
-            return field.endswith(condition.value)
-        elif condition.operator == FilterOperator.IS_NULL:
-            return field.is_(None)
-        elif condition.operator == FilterOperator.IS_NOT_NULL:
-            return field.isnot(None)
-        
-        raise ValueError(f"Unsupported operator: {condition.operator}")
+        return criteria
     
     def execute_query(self, filter_group: LogicGroup, game_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Execute query and return results"""
         query = self.build_query(filter_group, game_id)
-        results = query.all()
         
-        # Convert to dictionaries
-        return [self._row_to_dict(row) for row in results]
+        # Fetch driver-level row mappings rather than hydrating ORM instances
+        statement = query.with_entities(*self._result_columns).statement
+        rows = self.db_session.execute(statement).mappings().all()
+        return [dict(row) for row in rows]
     
     def get_query_stats(self, filter_group: LogicGroup, game_id: Optional[int] = None) -> Dict[str, Any]:
         """Get statistics about the query results"""
-        query = self.build_query(filter_group, game_id)
+        return self._compute_stats(self._build_criteria(filter_group, game_id))
+    
+    def _compute_stats(self, criteria: List[Any]) -> Dict[str, Any]:
+        """Run the stats aggregate for the given WHERE criteria"""
+        model = self.play_data_model
         
-        total_count = query.count()
+        # Count, average and successful plays (positive yards) in a single scan
+        statement = self._stats_statement.where(*criteria) if criteria else self._stats_statement
+        total_count, avg_yards, successful_plays = self.db_session.execute(statement).one()
         
         if total_count == 0:
             return {
@@ -220,16 +297,13 @@ class CustomQueryBuilder:
                 'play_types_count': 0
             }
         
-        # Calculate statistics
-        avg_yards = query.with_entities(func.avg(self.play_data_model.yards_gained)).scalar() or 0
-        
-        # Success rate (plays with positive yards)
-        successful_plays = query.filter(self.play_data_model.yards_gained > 0).count()
+        avg_yards = avg_yards or 0
         success_rate = (successful_plays / total_count) * 100 if total_count > 0 else 0
         
         # Unique formations and play types
-        formations_count = query.with_entities(self.play_data_model.formation).distinct().count()
-        play_types_count = query.with_entities(self.play_data_model.play_type).distinct().count()
+        query = self.base_query.filter(*criteria) if criteria else self.base_query
+        formations_count = query.with_entities(model.formation).distinct().count()
+        play_types_count = query.with_entities(model.play_type).distinct().count()
         
         return {
             'total_plays': total_count,
@@ -238,34 +312,20 @@ class CustomQueryBuilder:
             'formations_count': formations_count,
             'play_types_count': play_types_count
         }
-    
-    def _row_to_dict(self, row) -> Dict[str, Any]:
-        """Convert SQLAlchemy row to dictionary"""
-        return {
-            'id': row.id,
-            'game_id': row.game_id,
-            'play_id': row.play_id,
-            'down': row.down,
-            'distance': row.distance,
-            'yard_line': row.yard_line,
-            'formation': row.formation,
-            'play_type': row.play_type,
-            'play_name': row.play_name,
-            'result_of_play': row.result_of_play,
-            'yards_gained': row.yards_gained
-        }
 
 
 class QueryTemplate:
     """Saved query template for reuse"""
     
+    __slots__ = ('name', 'description', 'filter_group', 'created_by', 'tags')
+    
     def __init__(self, name: str, description: str, filter_group: LogicGroup, 
-                 created_by: Optional[str] = None, tags: Optional[List[str]] = None):
+                 created_by: Optional[str] = None, tags: Optional[List[str]] = None) -> None:
         self.name = name
         self.description = description
         self.filter_group = filter_group
         self.created_by = created_by
-        self.tags = tags or []
+        self.tags: List[str] = tags or []
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation"""
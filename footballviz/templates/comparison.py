@@ -14,6 +14,29 @@ from ..charts.base import FootballChart
 from ..core.colors import PerformanceColors, COMPARISON_PALETTE
 
 
+def _readonly_array(values: List[int], dtype: type) -> np.ndarray:
+    """Array that callers sharing it cannot modify in place"""
+    array = np.array(values, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+# Placeholder game review data, allocated once and shared read-only by each panel
+_GAME_REVIEW_DATA = {
+    'quarters': ('Q1', 'Q2', 'Q3', 'Q4'),
+    'quarter_points': _readonly_array([7, 14, 3, 10], np.int16),
+    'quarter_yards': _readonly_array([125, 180, 85, 160], np.int16),
+    'drive_outcomes': ('Touchdown', 'Field Goal', 'Punt', 'Turnover', 'Other'),
+    'drive_counts': _readonly_array([4, 2, 6, 1, 1], np.int8),
+    'situations': ('Red Zone', '3rd Down', 'Goal Line', '4th Down'),
+    'situation_attempts': _readonly_array([8, 12, 3, 2], np.int16),
+    'situation_successes': _readonly_array([6, 5, 3, 1], np.int16),
+    'expectation_metrics': ('Points', 'Yards', 'Turnovers'),
+    'actual': _readonly_array([34, 550, 1], np.int16),
+    'expected': _readonly_array([28, 480, 2], np.int16),
+}
+
+
 class PerformanceComparison(FootballChart):
     """
     Side-by-side performance comparison chart
@@ -103,38 +126,38 @@ class GameReview(FootballChart):
         self.data = data
         self.create_figure()
         
+        review = _GAME_REVIEW_DATA
+        
         # Create multi-panel layout
         gs = self.fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
         
         # Quarter-by-quarter performance
         ax1 = self.fig.add_subplot(gs[0, 0])
-        self._plot_quarter_performance(ax1)
+        self._plot_quarter_performance(ax1, review['quarters'],
+                                       review['quarter_points'], review['quarter_yards'])
         
         # Drive outcomes
         ax2 = self.fig.add_subplot(gs[0, 1])
-        self._plot_drive_outcomes(ax2)
+        self._plot_drive_outcomes(ax2, review['drive_outcomes'], review['drive_counts'])
         
         # Key situations
         ax3 = self.fig.add_subplot(gs[1, 0])
-        self._plot_key_situations(ax3)
+        self._plot_key_situations(ax3, review['situations'],
+                                  review['situation_attempts'], review['situation_successes'])
         
         # Performance vs expectation
         ax4 = self.fig.add_subplot(gs[1, 1])
-        self._plot_vs_expectation(ax4)
+        self._plot_vs_expectation(ax4, review['expectation_metrics'],
+                                  review['actual'], review['expected'])
         
         # Apply theme to all subplots
-        for ax in [ax1, ax2, ax3, ax4]:
-            self.theme.apply_to_figure(self.fig, ax)
+        self.theme.apply_to_axes(self.fig, [ax1, ax2, ax3, ax4])
         
         self.optimize_layout()
         return self
     
-    def _plot_quarter_performance(self, ax):
+    def _plot_quarter_performance(self, ax, quarters, points: np.ndarray, yards: np.ndarray):
         """Plot performance by quarter"""
-        quarters = ['Q1', 'Q2', 'Q3', 'Q4']
-        points = [7, 14, 3, 10]  # Placeholder data
-        yards = [125, 180, 85, 160]  # Placeholder data
-        
         ax2 = ax.twinx()
         
         bars = ax.bar(quarters, points, color=self.theme.config.team_primary, alpha=0.8, label='Points')
@@ -148,11 +171,8 @@ class GameReview(FootballChart):
         ax.tick_params(axis='y', labelcolor=self.theme.config.team_primary)
         ax2.tick_params(axis='y', labelcolor=PerformanceColors.EMPHASIS)
     
-    def _plot_drive_outcomes(self, ax):
+    def _plot_drive_outcomes(self, ax, outcomes, counts: np.ndarray):
         """Plot drive outcome distribution"""
-        outcomes = ['Touchdown', 'Field Goal', 'Punt', 'Turnover', 'Other']
-        counts = [4, 2, 6, 1, 1]  # Placeholder data
-        
         colors = [PerformanceColors.ELITE, PerformanceColors.GOOD, 
                  PerformanceColors.AVERAGE, PerformanceColors.CONCERN,
                  PerformanceColors.NEUTRAL]
@@ -168,14 +188,10 @@ class GameReview(FootballChart):
             autotext.set_color('white')
             autotext.set_fontweight('bold')
     
-    def _plot_key_situations(self, ax):
+    def _plot_key_situations(self, ax, situations, attempts: np.ndarray, successes: np.ndarray):
         """Plot key situational performance"""
-        situations = ['Red Zone', '3rd Down', 'Goal Line', '4th Down']
-        attempts = [8, 12, 3, 2]  # Placeholder data
-        successes = [6, 5, 3, 1]  # Placeholder data
-        
-        success_rates = [(s/a*100) if a > 0 else 0 for s, a in zip(successes, attempts)]
-        colors = [PerformanceColors.get_performance_color(rate) for rate in success_rates]
+        success_rates = np.where(attempts > 0, successes / np.maximum(attempts, 1) * 100, 0.0)
+        colors = PerformanceColors.get_performance_colors(success_rates)
         
         bars = ax.bar(situations, success_rates, color=colors, alpha=0.85)
         
@@ -191,12 +207,8 @@ class GameReview(FootballChart):
         ax.set_title('Key Situations Performance')
         ax.set_ylim(0, 100)
     
-    def _plot_vs_expectation(self, ax):
+    def _plot_vs_expectation(self, ax, metrics, actual: np.ndarray, expected: np.ndarray):
         """Plot actual vs expected performance"""
-        metrics = ['Points', 'Yards', 'Turnovers']
-        actual = [34, 550, 1]  # Placeholder data
-        expected = [28, 480, 2]  # Placeholder data
-        
         x = np.arange(len(metrics))
         width = 0.35
         
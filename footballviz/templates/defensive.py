@@ -7,8 +7,8 @@ Specialized chart templates for defensive performance analysis:
 - Situational defensive performance
 """
 
+from functools import cached_property
 from typing import Dict, List, Any, Optional
-import numpy as np
 
 from ..charts.base import FootballChart
 from ..utils.data_processor import FootballDataProcessor
@@ -27,7 +27,11 @@ class DefensiveBreakdown(FootballChart):
             title="Defensive Performance Breakdown",
             **kwargs
         )
-        self.processor = FootballDataProcessor()
+    
+    @cached_property
+    def processor(self) -> FootballDataProcessor:
+        """Data processor, created on first use"""
+        return FootballDataProcessor()
     
     def plot(self, data: Dict[str, Any], **kwargs) -> 'DefensiveBreakdown':
         """
@@ -51,7 +55,7 @@ class DefensiveBreakdown(FootballChart):
         
         labels = list(defensive_metrics.keys())
         values = list(defensive_metrics.values())
-        colors = [PerformanceColors.get_performance_color(v) for v in values]
+        colors = PerformanceColors.get_performance_colors(values)
         
         bars = self.ax.bar(labels, values, color=colors, alpha=0.85)
         
@@ -100,7 +104,7 @@ class SituationalAnalysis(FootballChart):
         situations = ['1st Down', '2nd Down', '3rd Down', '4th Down', 'Red Zone', 'Goal Line']
         success_rates = [65, 58, 42, 35, 78, 85]
         
-        colors = [PerformanceColors.get_performance_color(rate) for rate in success_rates]
+        colors = PerformanceColors.get_performance_colors(success_rates)
         bars = self.ax.barh(situations, success_rates, color=colors, alpha=0.85)
         
         # Add value labels
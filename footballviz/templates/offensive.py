@@ -7,9 +7,11 @@ Specialized chart templates for offensive performance analysis:
 - Field position impact visualization
 """
 
+import heapq
+from functools import cached_property, lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.colors import to_rgb, to_rgba_array
 from matplotlib.patches import Rectangle
 
 from ..charts.base import FootballChart
@@ -17,6 +19,55 @@ from ..utils.data_processor import FootballDataProcessor, EfficiencyCalculator
 from ..core.colors import PerformanceColors, OFFENSIVE_PALETTE
 
 
+# GridSpec spacing shared by the multi-panel offensive charts
+_PANEL_SPACING = {'hspace': 0.3, 'wspace': 0.3}
+
+# Panel cells (row, column) on each chart's grid, in plotting order
+_EFFICIENCY_PANELS = ((0, slice(0, 2)), (0, 2), (1, 0), (1, 1), (1, 2))
+_FIELD_POSITION_PANELS = ((0, slice(None)), (1, 0), (1, 1))
+_PERSONNEL_PANELS = ((0, 0), (0, 1), (1, 0), (1, 1))
+
+
+def _add_panels(fig, shape: Tuple[int, int], cells) -> List[Any]:
+    """Create one axes per cell on a single GridSpec of the given (rows, columns) shape"""
+    gs = fig.add_gridspec(*shape, **_PANEL_SPACING)
+    return [fig.add_subplot(gs[cell]) for cell in cells]
+
+
+# Opacity of the scoring-rate tint laid over the heat map field
+_ZONE_TINT_ALPHA = 0.4
+
+
+@lru_cache(maxsize=8)
+def _field_background(background_color: str) -> np.ndarray:
+    """Solid 20x100 yard RGB field image in the given color; callers copy before tinting"""
+    image = np.empty((20, 100, 3))
+    image[...] = to_rgb(background_color)
+    image.setflags(write=False)
+    return image
+
+
+def _unpack_formation_stats(formation_items) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split (formation, stats) pairs into aligned columns in a single pass
+    
+    Returns:
+        Formation names plus success rate, average yards and play count arrays
+    """
+    formations, success_rates, avg_yards, counts = [], [], [], []
+    for formation, stats in formation_items:
+        formations.append(formation)
+        success_rates.append(stats.get('success_rate', 0))
+        avg_yards.append(stats.get('avg_yards', 0))
+        counts.append(stats.get('count', 0))
+    
+    # Chart inputs only need display precision
+    return (formations,
+            np.asarray(success_rates, dtype=np.float32),
+            np.asarray(avg_yards, dtype=np.float32),
+            np.asarray(counts, dtype=np.int32))
+
+
 class OffensiveEfficiency(FootballChart):
     """
     Comprehensive offensive efficiency analysis chart
@@ -35,7 +86,11 @@ class OffensiveEfficiency(FootballChart):
             title="Offensive Efficiency Analysis",
             **kwargs
         )
-        self.processor = FootballDataProcessor()
+    
+    @cached_property
+    def processor(self) -> FootballDataProcessor:
+        """Data processor, created on first use"""
+        return FootballDataProcessor()
     
     def plot(self, 
              data: Dict[str, Any], 
@@ -54,38 +109,45 @@ class OffensiveEfficiency(FootballChart):
         self.data = data
         self.create_figure()
         
+        # Nothing to break down: show a single message instead of five empty panels
+        summary = data.get('summary')
+        if ((summary is None or summary.total_plays == 0) and not data.get('situational')
+                and not data.get('formations') and not data.get('down_distance')):
+            self.ax.text(0.5, 0.5, 'No play data available for efficiency analysis',
+                        ha='center', va='center', transform=self.ax.transAxes,
+                        **self.theme.font_manager.get_text_properties('title',
+                                                                    self.theme.config.secondary_text_color))
+            return self
+        
         # Create subplots for different efficiency metrics
-        gs = self.fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
+        ax_main, ax_situational, ax_down_distance, ax_formations, ax_trends = _add_panels(
+            self.fig, (2, 3), _EFFICIENCY_PANELS)
         
         # Main efficiency metrics (top row, spans 2 columns)
-        ax_main = self.fig.add_subplot(gs[0, :2])
         self._plot_main_efficiency_metrics(ax_main, data, comparison_data)
         
         # Situational breakdown (top right)
-        ax_situational = self.fig.add_subplot(gs[0, 2])
         self._plot_situational_efficiency(ax_situational, data)
         
         # Down and distance analysis (bottom left)
-        ax_down_distance = self.fig.add_subplot(gs[1, 0])
         self._plot_down_distance_efficiency(ax_down_distance, data)
         
         # Formation efficiency (bottom center)
-        ax_formations = self.fig.add_subplot(gs[1, 1])
         self._plot_formation_efficiency(ax_formations, data)
         
         # Efficiency trends (bottom right)
-        ax_trends = self.fig.add_subplot(gs[1, 2])
         self._plot_efficiency_trends(ax_trends, data)
         
         # Apply theme to all subplots
-        for ax in [ax_main, ax_situational, ax_down_distance, ax_formations, ax_trends]:
-            self.theme.apply_to_figure(self.fig, ax)
+        self.theme.apply_to_axes(self.fig, [ax_main, ax_situational, ax_down_distance, ax_formations, ax_trends])
         
         self.optimize_layout()
         return self
     
     def _plot_main_efficiency_metrics(self, ax, data: Dict[str, Any], comparison_data: Optional[Dict[str, Any]]):
         """Plot main efficiency metrics bar chart"""
+        font_manager = self.theme.font_manager
+        config = self.theme.config
         
         situational = data.get('situational', {})
         summary = data.get('summary')
@@ -104,9 +166,9 @@ class OffensiveEfficiency(FootballChart):
         labels = list(metrics.keys())
         
         # Color bars based on performance
-        colors = [PerformanceColors.get_performance_color(v) for v in values]
+        colors = PerformanceColors.get_performance_colors(values)
         
-        bars = ax.bar(x_pos, values, color=colors, alpha=0.85, edgecolor='white', linewidth=1.5)
+        ax.bar(x_pos, values, tick_label=labels, color=colors, alpha=0.85, edgecolor='white', linewidth=1.5)
         
         # Add comparison data if provided
         if comparison_data:
@@ -124,29 +186,23 @@ class OffensiveEfficiency(FootballChart):
             # Add comparison bars (slightly offset)
             x_offset = 0.25
             comp_bars = ax.bar(x_pos + x_offset, comp_values, 
-                             width=0.5, color=self.theme.config.opponent_color, 
+                             width=0.5, color=config.opponent_color, 
                              alpha=0.7, label='Opponent')
         
         # Add data labels
-        for i, (bar, value) in enumerate(zip(bars, values)):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                   f'{value:.1f}%', ha='center', va='bottom',
-                   **self.theme.font_manager.get_text_properties('data_labels',
-                                                               self.theme.config.primary_text_color))
+        label_props = font_manager.get_text_properties('data_labels', config.primary_text_color)
+        for x, y, value in zip(x_pos, np.asarray(values) + 1, values):
+            ax.text(x, y, f'{value:.1f}%', ha='center', va='bottom', **label_props)
         
         # Styling
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(labels)
         ax.set_ylabel('Success Rate (%)')
         ax.set_title('Key Offensive Efficiency Metrics', 
-                    **self.theme.font_manager.get_text_properties('subtitle',
-                                                                self.theme.config.primary_text_color))
+                    **font_manager.get_text_properties('subtitle', config.primary_text_color))
         
         # Add league average reference lines
         league_averages = {'red_zone': 55, 'third_down': 40, 'goal_line': 65, 'short_yardage': 70, 'overall': 45}
-        for i, avg in enumerate(league_averages.values()):
-            ax.axhline(y=avg, color=PerformanceColors.NEUTRAL, linestyle='--', alpha=0.5, linewidth=1)
+        ax.hlines(list(league_averages.values()), 0, 1, transform=ax.get_yaxis_transform(),
+                  colors=PerformanceColors.NEUTRAL, linestyles='--', alpha=0.5, linewidth=1)
         
         ax.set_ylim(0, 100)
         self.format_percentage_axis(ax, 'y')
@@ -156,6 +212,8 @@ class OffensiveEfficiency(FootballChart):
     
     def _plot_situational_efficiency(self, ax, data: Dict[str, Any]):
         """Plot situational efficiency radar/polar chart"""
+        font_manager = self.theme.font_manager
+        config = self.theme.config
         
         situational = data.get('situational', {})
         
@@ -171,24 +229,18 @@ class OffensiveEfficiency(FootballChart):
         
         # Create simple bar chart (radar would be more complex)
         y_pos = np.arange(len(situations))
-        colors = [PerformanceColors.get_performance_color(v) for v in values]
+        colors = PerformanceColors.get_performance_colors(values)
         
-        bars = ax.barh(y_pos, values, color=colors, alpha=0.85)
+        ax.barh(y_pos, values, tick_label=situations, color=colors, alpha=0.85)
         
         # Add value labels
-        for i, (bar, value) in enumerate(zip(bars, values)):
-            width = bar.get_width()
-            ax.text(width + 1, bar.get_y() + bar.get_height()/2,
-                   f'{value:.1f}%', ha='left', va='center',
-                   **self.theme.font_manager.get_text_properties('data_labels',
-                                                               self.theme.config.primary_text_color))
-        
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels(situations)
+        label_props = font_manager.get_text_properties('data_labels', config.primary_text_color)
+        for x, y, value in zip(np.asarray(values) + 1, y_pos, values):
+            ax.text(x, y, f'{value:.1f}%', ha='left', va='center', **label_props)
+        
         ax.set_xlabel('Success Rate (%)')
         ax.set_title('Situational Performance',
-                    **self.theme.font_manager.get_text_properties('subtitle',
-                                                                self.theme.config.primary_text_color))
+                    **font_manager.get_text_properties('subtitle', config.primary_text_color))
         ax.set_xlim(0, 100)
     
     def _plot_down_distance_efficiency(self, ax, data: Dict[str, Any]):
@@ -232,6 +284,8 @@ class OffensiveEfficiency(FootballChart):
     
     def _plot_formation_efficiency(self, ax, data: Dict[str, Any]):
         """Plot formation efficiency analysis"""
+        font_manager = self.theme.font_manager
+        config = self.theme.config
         
         formations_data = data.get('formations', {})
         
@@ -241,21 +295,19 @@ class OffensiveEfficiency(FootballChart):
             return
         
         # Get top 5 most used formations
-        sorted_formations = sorted(formations_data.items(), 
-                                 key=lambda x: x[1].get('count', 0), reverse=True)[:5]
+        sorted_formations = heapq.nlargest(5, formations_data.items(),
+                                           key=lambda x: x[1].get('count', 0))
         
-        formations = [f[0] for f in sorted_formations]
-        efficiencies = [f[1].get('success_rate', 0) for f in sorted_formations]
-        counts = [f[1].get('count', 0) for f in sorted_formations]
+        formations, efficiencies, _, counts = _unpack_formation_stats(sorted_formations)
         
         # Bubble chart: x=formation, y=efficiency, size=usage
         x_pos = np.arange(len(formations))
         
         # Normalize bubble sizes
-        max_count = max(counts) if counts else 1
-        bubble_sizes = [(c / max_count) * 1000 + 100 for c in counts]
+        max_count = counts.max() if counts.size else 1
+        bubble_sizes = counts * (1000.0 / max_count) + 100.0
         
-        colors = [PerformanceColors.get_performance_color(e) for e in efficiencies]
+        colors = PerformanceColors.get_performance_colors(efficiencies)
         
         scatter = ax.scatter(x_pos, efficiencies, s=bubble_sizes, c=colors, 
                            alpha=0.7, edgecolors='white', linewidth=2)
@@ -264,17 +316,17 @@ class OffensiveEfficiency(FootballChart):
         ax.set_xticklabels(formations, rotation=45, ha='right')
         ax.set_ylabel('Success Rate (%)')
         ax.set_title('Formation Efficiency\n(Bubble size = Usage)',
-                    **self.theme.font_manager.get_text_properties('subtitle',
-                                                                self.theme.config.primary_text_color))
+                    **font_manager.get_text_properties('subtitle', config.primary_text_color))
         
         # Add count labels
-        for i, (x, y, count) in enumerate(zip(x_pos, efficiencies, counts)):
-            ax.text(x, y, str(count), ha='center', va='center',
-                   **self.theme.font_manager.get_text_properties('data_labels',
-                                                               self.theme.config.background_color))
+        label_props = font_manager.get_text_properties('data_labels', config.background_color)
+        for x, y, count in zip(x_pos, efficiencies, counts):
+            ax.text(x, y, str(count), ha='center', va='center', **label_props)
     
     def _plot_efficiency_trends(self, ax, data: Dict[str, Any]):
         """Plot efficiency trends (would need game-by-game data)"""
+        font_manager = self.theme.font_manager
+        config = self.theme.config
         
         # Placeholder for trend analysis
         # In real implementation, would show efficiency across games
@@ -288,29 +340,25 @@ class OffensiveEfficiency(FootballChart):
         # Show efficiency distribution as histogram
         # This is a simplified version - real implementation would use time series
         
-        metrics = [
+        metrics = np.array([
             summary.success_rate,
             summary.avg_yards_per_play * 10,  # Scale for visibility
             (summary.explosive_plays / summary.total_plays * 100) if summary.total_plays > 0 else 0
-        ]
+        ], dtype=np.float64)
         
         metric_names = ['Success\nRate', 'Yards/Play\n(x10)', 'Explosive\nPlay %']
         
-        bars = ax.bar(metric_names, metrics, 
-                     color=[PerformanceColors.get_performance_color(m) for m in metrics],
-                     alpha=0.8)
+        ax.bar(metric_names, metrics, 
+               color=PerformanceColors.get_performance_colors(metrics),
+               alpha=0.8)
         
         # Add value labels
-        for bar, value in zip(bars, metrics):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                   f'{value:.1f}', ha='center', va='bottom',
-                   **self.theme.font_manager.get_text_properties('data_labels',
-                                                               self.theme.config.primary_text_color))
+        label_props = font_manager.get_text_properties('data_labels', config.primary_text_color)
+        for x, y, value in zip(range(len(metrics)), metrics + 0.5, metrics):
+            ax.text(x, y, f'{value:.1f}', ha='center', va='bottom', **label_props)
         
         ax.set_title('Performance Summary',
-                    **self.theme.font_manager.get_text_properties('subtitle',
-                                                                self.theme.config.primary_text_color))
+                    **font_manager.get_text_properties('subtitle', config.primary_text_color))
         ax.set_ylabel('Value')
 
 
@@ -347,51 +395,40 @@ class PersonnelEffectiveness(FootballChart):
             return self
         
         # Create matrix-style visualization
-        formations = list(formations_data.keys())
-        
         # Metrics: success rate, avg yards, usage frequency
-        success_rates = [data.get('success_rate', 0) for data in formations_data.values()]
-        avg_yards = [data.get('avg_yards', 0) for data in formations_data.values()]
-        usage_counts = [data.get('count', 0) for data in formations_data.values()]
+        formations, success_rates, avg_yards, usage_counts = _unpack_formation_stats(formations_data.items())
         
         # Create subplots
-        gs = self.fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
+        ax1, ax2, ax3, ax4 = _add_panels(self.fig, (2, 2), _PERSONNEL_PANELS)
         
         # Success rate by formation
-        ax1 = self.fig.add_subplot(gs[0, 0])
         self._plot_formation_success_rates(ax1, formations, success_rates)
         
         # Average yards by formation
-        ax2 = self.fig.add_subplot(gs[0, 1])
         self._plot_formation_yards(ax2, formations, avg_yards)
         
         # Usage frequency
-        ax3 = self.fig.add_subplot(gs[1, 0])
         self._plot_formation_usage(ax3, formations, usage_counts)
         
         # Efficiency matrix
-        ax4 = self.fig.add_subplot(gs[1, 1])
         self._plot_efficiency_matrix(ax4, formations, success_rates, avg_yards, usage_counts)
         
         # Apply theme to all subplots
-        for ax in [ax1, ax2, ax3, ax4]:
-            self.theme.apply_to_figure(self.fig, ax)
+        self.theme.apply_to_axes(self.fig, [ax1, ax2, ax3, ax4])
         
         self.optimize_layout()
         return self
     
     def _plot_formation_success_rates(self, ax, formations, success_rates):
         """Plot formation success rates"""
-        colors = [PerformanceColors.get_performance_color(rate) for rate in success_rates]
-        bars = ax.barh(formations, success_rates, color=colors, alpha=0.85)
+        colors = PerformanceColors.get_performance_colors(success_rates)
+        ax.barh(formations, success_rates, color=colors, alpha=0.85)
         
         # Add value labels
-        for bar, rate in zip(bars, success_rates):
-            width = bar.get_width()
-            ax.text(width + 1, bar.get_y() + bar.get_height()/2,
-                   f'{rate:.1f}%', ha='left', va='center',
-                   **self.theme.font_manager.get_text_properties('data_labels',
-                                                               self.theme.config.primary_text_color))
+        label_props = self.theme.font_manager.get_text_properties('data_labels',
+                                                                 self.theme.config.primary_text_color)
+        for x, y, rate in zip(np.asarray(success_rates) + 1, range(len(success_rates)), success_rates):
+            ax.text(x, y, f'{rate:.1f}%', ha='left', va='center', **label_props)
         
         ax.set_xlabel('Success Rate (%)')
         ax.set_title('Formation Success Rates')
@@ -399,23 +436,22 @@ class PersonnelEffectiveness(FootballChart):
     
     def _plot_formation_yards(self, ax, formations, avg_yards):
         """Plot average yards by formation"""
-        colors = [PerformanceColors.get_performance_color(yards * 10) for yards in avg_yards]  # Scale for color
-        bars = ax.barh(formations, avg_yards, color=colors, alpha=0.85)
+        colors = PerformanceColors.get_performance_colors(np.asarray(avg_yards) * 10)  # Scale for color
+        ax.barh(formations, avg_yards, color=colors, alpha=0.85)
         
-        for bar, yards in zip(bars, avg_yards):
-            width = bar.get_width()
-            ax.text(width + 0.1, bar.get_y() + bar.get_height()/2,
-                   f'{yards:.1f}', ha='left', va='center',
-                   **self.theme.font_manager.get_text_properties('data_labels',
-                                                               self.theme.config.primary_text_color))
+        label_props = self.theme.font_manager.get_text_properties('data_labels',
+                                                                 self.theme.config.primary_text_color)
+        for x, y, yards in zip(np.asarray(avg_yards) + 0.1, range(len(avg_yards)), avg_yards):
+            ax.text(x, y, f'{yards:.1f}', ha='left', va='center', **label_props)
         
         ax.set_xlabel('Average Yards per Play')
         ax.set_title('Yards per Play by Formation')
     
     def _plot_formation_usage(self, ax, formations, usage_counts):
         """Plot formation usage frequency"""
-        total_plays = sum(usage_counts)
-        percentages = [(count / total_plays * 100) if total_plays > 0 else 0 for count in usage_counts]
+        config = self.theme.config
+        total_plays = usage_counts.sum()
+        percentages = usage_counts * (100.0 / total_plays) if total_plays > 0 else np.zeros(len(usage_counts))
         
         # Pie chart for usage
         colors = self.theme.get_color_palette('performance', len(formations))
@@ -425,9 +461,11 @@ class PersonnelEffectiveness(FootballChart):
         ax.set_title('Formation Usage Distribution')
         
         # Style the text
+        label_color = config.secondary_text_color
+        label_size = self.theme.font_manager.get_font('annotations')['size']
         for text in texts:
-            text.set_color(self.theme.config.secondary_text_color)
-            text.set_fontsize(self.theme.font_manager.get_font('annotations')['size'])
+            text.set_color(label_color)
+            text.set_fontsize(label_size)
         
         for autotext in autotexts:
             autotext.set_color('white')
@@ -436,28 +474,28 @@ class PersonnelEffectiveness(FootballChart):
     def _plot_efficiency_matrix(self, ax, formations, success_rates, avg_yards, usage_counts):
         """Plot efficiency matrix scatter plot"""
         # Normalize bubble sizes
-        max_usage = max(usage_counts) if usage_counts else 1
-        bubble_sizes = [(count / max_usage) * 1000 + 100 for count in usage_counts]
+        max_usage = usage_counts.max() if usage_counts.size else 1
+        bubble_sizes = usage_counts * (1000.0 / max_usage) + 100.0
         
-        colors = [PerformanceColors.get_performance_color(rate) for rate in success_rates]
+        colors = PerformanceColors.get_performance_colors(success_rates)
         
         scatter = ax.scatter(avg_yards, success_rates, s=bubble_sizes, c=colors,
                            alpha=0.7, edgecolors='white', linewidth=2)
         
         # Add formation labels
-        for i, formation in enumerate(formations):
-            ax.annotate(formation, (avg_yards[i], success_rates[i]),
-                       xytext=(5, 5), textcoords='offset points',
-                       **self.theme.font_manager.get_text_properties('annotations',
-                                                                   self.theme.config.tertiary_text_color))
+        annotate = ax.annotate
+        label_props = self.theme.font_manager.get_text_properties('annotations',
+                                                                 self.theme.config.tertiary_text_color)
+        for formation, x, y in zip(formations, avg_yards.tolist(), success_rates.tolist()):
+            annotate(formation, (x, y), xytext=(5, 5), textcoords='offset points', **label_props)
         
         ax.set_xlabel('Average Yards per Play')
         ax.set_ylabel('Success Rate (%)')
         ax.set_title('Formation Efficiency Matrix\n(Bubble size = Usage frequency)')
         
         # Add quadrant lines
-        avg_success = np.mean(success_rates) if success_rates else 50
-        avg_yards_mean = np.mean(avg_yards) if avg_yards else 5
+        avg_success = success_rates.mean() if success_rates.size else 50
+        avg_yards_mean = avg_yards.mean() if avg_yards.size else 5
         
         ax.axhline(y=avg_success, color=PerformanceColors.NEUTRAL, linestyle='--', alpha=0.5)
         ax.axvline(x=avg_yards_mean, color=PerformanceColors.NEUTRAL, linestyle='--', alpha=0.5)
@@ -505,23 +543,19 @@ class FieldPositionImpact(FootballChart):
         drive_counts = [data['drives'] for data in field_zones.values()]
         
         # Create subplots
-        gs = self.fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
+        ax1, ax2, ax3 = _add_panels(self.fig, (2, 2), _FIELD_POSITION_PANELS)
         
         # Scoring rate by field position
-        ax1 = self.fig.add_subplot(gs[0, :])
         self._plot_field_position_scoring(ax1, zones, scoring_rates, drive_counts)
         
         # Efficiency by field zone
-        ax2 = self.fig.add_subplot(gs[1, 0])
         self._plot_zone_efficiency(ax2, zones, avg_yards)
         
         # Field position heat map
-        ax3 = self.fig.add_subplot(gs[1, 1])
         self._plot_field_heatmap(ax3, field_zones)
         
         # Apply theme
-        for ax in [ax1, ax2, ax3]:
-            self.theme.apply_to_figure(self.fig, ax)
+        self.theme.apply_to_axes(self.fig, [ax1, ax2, ax3])
         
         self.optimize_layout()
         return self
@@ -531,16 +565,14 @@ class FieldPositionImpact(FootballChart):
         x_pos = np.arange(len(zones))
         
         # Color bars based on scoring rate
-        colors = [PerformanceColors.get_performance_color(rate) for rate in scoring_rates]
-        bars = ax.bar(x_pos, scoring_rates, color=colors, alpha=0.85)
+        colors = PerformanceColors.get_performance_colors(scoring_rates)
+        ax.bar(x_pos, scoring_rates, color=colors, alpha=0.85)
         
         # Add drive count annotations
-        for i, (bar, rate, count) in enumerate(zip(bars, scoring_rates, drive_counts)):
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 2,
-                   f'{rate}%\n({count} drives)', ha='center', va='bottom',
-                   **self.theme.font_manager.get_text_properties('data_labels',
-                                                               self.theme.config.primary_text_color))
+        label_props = self.theme.font_manager.get_text_properties('data_labels',
+                                                                 self.theme.config.primary_text_color)
+        for x, y, rate, count in zip(x_pos, np.asarray(scoring_rates) + 2, scoring_rates, drive_counts):
+            ax.text(x, y, f'{rate}%\n({count} drives)', ha='center', va='bottom', **label_props)
         
         ax.set_xticks(x_pos)
         ax.set_xticklabels(zones, rotation=45, ha='right')
@@ -550,55 +582,55 @@ class FieldPositionImpact(FootballChart):
     
     def _plot_zone_efficiency(self, ax, zones, avg_yards):
         """Plot efficiency by field zone"""
-        colors = [PerformanceColors.get_performance_color(yards * 15) for yards in avg_yards]
-        bars = ax.barh(zones, avg_yards, color=colors, alpha=0.85)
+        colors = PerformanceColors.get_performance_colors(np.asarray(avg_yards) * 15)
+        ax.barh(zones, avg_yards, color=colors, alpha=0.85)
         
-        for bar, yards in zip(bars, avg_yards):
-            width = bar.get_width()
-            ax.text(width + 0.1, bar.get_y() + bar.get_height()/2,
-                   f'{yards:.1f}', ha='left', va='center',
-                   **self.theme.font_manager.get_text_properties('data_labels',
-                                                               self.theme.config.primary_text_color))
+        label_props = self.theme.font_manager.get_text_properties('data_labels',
+                                                                 self.theme.config.primary_text_color)
+        for x, y, yards in zip(np.asarray(avg_yards) + 0.1, range(len(avg_yards)), avg_yards):
+            ax.text(x, y, f'{yards:.1f}', ha='left', va='center', **label_props)
         
         ax.set_xlabel('Average Yards per Play')
         ax.set_title('Offensive Efficiency by Field Zone')
     
     def _plot_field_heatmap(self, ax, field_zones):
         """Create field position heat map visualization"""
+        font_manager = self.theme.font_manager
+        config = self.theme.config
+        
         # Simplified field representation
         field_length = 100
         field_width = 20
         
-        # Create field background
-        field_rect = Rectangle((0, 0), field_length, field_width, 
-                             facecolor=self.theme.config.background_color,
-                             edgecolor='white', linewidth=2)
-        ax.add_patch(field_rect)
+        # Field border
+        ax.add_patch(Rectangle((0, 0), field_length, field_width,
+                               fill=False, edgecolor='white', linewidth=2))
         
         # Add yard lines
-        for yard in range(0, 101, 10):
-            ax.axvline(x=yard, color='white', alpha=0.3, linewidth=1)
+        ax.vlines(np.arange(0, 101, 10), 0, 1, transform=ax.get_xaxis_transform(),
+                  colors='white', alpha=0.3, linewidth=1)
         
         # Add zone coloring based on scoring rates
         zone_boundaries = [0, 20, 40, 50, 70, 80, 100]
         zone_data = list(field_zones.values())
-        
-        for i in range(len(zone_boundaries) - 1):
-            start = zone_boundaries[i]
-            end = zone_boundaries[i + 1]
-            if i < len(zone_data):
-                scoring_rate = zone_data[i]['scoring_rate']
-                color = PerformanceColors.get_performance_color(scoring_rate)
-                
-                zone_rect = Rectangle((start, 2), end - start, field_width - 4,
-                                    facecolor=color, alpha=0.4)
-                ax.add_patch(zone_rect)
-                
-                # Add zone label
-                ax.text(start + (end - start) / 2, field_width / 2,
-                       f'{scoring_rate}%', ha='center', va='center',
-                       **self.theme.font_manager.get_text_properties('data_labels',
-                                                                   self.theme.config.primary_text_color))
+        zone_colors = PerformanceColors.get_performance_colors([zone['scoring_rate'] for zone in zone_data])
+        label_props = font_manager.get_text_properties('data_labels', config.primary_text_color)
+        n_zones = min(len(zone_data), len(zone_boundaries) - 1)
+        zone_edges = np.asarray(zone_boundaries[:n_zones + 1])
+        
+        # Background and zone tints composited into one yard-resolution image
+        field_image = _field_background(config.background_color).copy()
+        zone_tints = np.repeat(to_rgba_array(zone_colors[:n_zones])[:, :3], np.diff(zone_edges), axis=0)
+        band = field_image[2:field_width - 2, :zone_edges[-1]]
+        band *= 1 - _ZONE_TINT_ALPHA
+        band += _ZONE_TINT_ALPHA * zone_tints
+        ax.imshow(field_image, extent=(0, field_length, 0, field_width),
+                  origin='lower', interpolation='nearest', zorder=1)
+        
+        # Add zone labels
+        zone_centers = (zone_edges[:-1] + zone_edges[1:]) / 2
+        for x, zone in zip(zone_centers, zone_data):
+            ax.text(x, field_width / 2, f"{zone['scoring_rate']}%", ha='center', va='center', **label_props)
         
         ax.set_xlim(0, 100)
         ax.set_ylim(0, field_width)
@@ -611,8 +643,6 @@ class FieldPositionImpact(FootballChart):
         
         # Add end zone labels
         ax.text(-5, field_width / 2, 'Own\nGoal', ha='center', va='center', rotation=90,
-               **self.theme.font_manager.get_text_properties('annotations',
-                                                           self.theme.config.secondary_text_color))
+               **font_manager.get_text_properties('annotations', config.secondary_text_color))
         ax.text(105, field_width / 2, 'Opp\nGoal', ha='center', va='center', rotation=90,
-               **self.theme.font_manager.get_text_properties('annotations',
-                                                           self.theme.config.secondary_text_color))
\ No newline at end of file
+               **font_manager.get_text_properties('annotations', config.secondary_text_color))
\ No newline at end of file
@@ -47,22 +47,21 @@ class CriticalSituations(FootballChart):
             'Two-Minute (Attempts: 4)': {'success_rate': 25, 'attempts': 4, 'successes': 1}
         }
         
-        labels = list(situations.keys())
-        success_rates = [data['success_rate'] for data in situations.values()]
-        colors = [PerformanceColors.get_performance_color(rate) for rate in success_rates]
+        labels, success_rates, successes, attempts = zip(*(
+            (label, data['success_rate'], data['successes'], data['attempts'])
+            for label, data in situations.items()
+        ))
+        colors = PerformanceColors.get_performance_colors(success_rates)
         
         bars = self.ax.barh(labels, success_rates, color=colors, alpha=0.85)
         
         # Add success/attempt labels
-        for i, (bar, situation_data) in enumerate(zip(bars, situations.values())):
-            width = bar.get_width()
-            successes = situation_data['successes']
-            attempts = situation_data['attempts']
-            self.ax.text(width + 2, bar.get_y() + bar.get_height()/2,
-                       f'{successes}/{attempts} ({width:.0f}%)', 
-                       ha='left', va='center',
-                       **self.theme.font_manager.get_text_properties('data_labels',
-                                                                   self.theme.config.primary_text_color))
+        label_props = self.theme.font_manager.get_text_properties('data_labels',
+                                                                  self.theme.config.primary_text_color)
+        for bar, made, attempted, rate in zip(bars, successes, attempts, success_rates):
+            self.ax.text(rate + 2, bar.get_y() + bar.get_height()/2,
+                       f'{made}/{attempted} ({rate:.0f}%)', 
+                       ha='left', va='center', **label_props)
         
         self.ax.set_xlabel('Success Rate (%)')
         self.ax.set_title('Performance in Critical Situations')
@@ -113,22 +112,24 @@ class MomentumAnalysis(FootballChart):
         score_diffs = [data['score_diff'] for data in timeline.values()]
         momentum_scores = [data['momentum'] for data in timeline.values()]
         
-        # Create dual-axis chart
-        ax2 = self.ax.twinx()
-        
-        # Score differential bars
-        color_map = [PerformanceColors.GOOD if diff > 0 else 
-                    PerformanceColors.CONCERN if diff < 0 else 
-                    PerformanceColors.NEUTRAL for diff in score_diffs]
+        # Score differential bars, colored by the sign of each differential
+        score_diffs_arr = np.asarray(score_diffs)
+        sign_colors = np.array([PerformanceColors.CONCERN, PerformanceColors.NEUTRAL, PerformanceColors.GOOD])
+        color_map = sign_colors[np.sign(score_diffs_arr).astype(np.intp) + 1]
         
         bars = self.ax.bar(quarters, score_diffs, color=color_map, alpha=0.7, label='Score Differential')
         
+        # Momentum (0-100) is drawn on the score axis, rescaled so its range
+        # spans the largest differential; a secondary axis maps it back
+        scale = max(np.abs(score_diffs_arr).max(), 1) / 100.0
+        ax2 = self.ax.secondary_yaxis('right', functions=(lambda y: y / scale, lambda m: m * scale))
+        
         # Momentum line
-        line = ax2.plot(quarters, momentum_scores, color=PerformanceColors.EMPHASIS,
-                       marker='o', linewidth=3, markersize=8, label='Momentum Score')
+        line = self.ax.plot(quarters, np.asarray(momentum_scores) * scale, color=PerformanceColors.EMPHASIS,
+                            marker='o', linewidth=3, markersize=8, label='Momentum Score')
         
         # Add horizontal line at 50% momentum
-        ax2.axhline(y=50, color=PerformanceColors.NEUTRAL, linestyle='--', alpha=0.5)
+        self.ax.axhline(y=50 * scale, color=PerformanceColors.NEUTRAL, linestyle='--', alpha=0.5)
         
         self.ax.set_ylabel('Score Differential', color=self.theme.config.team_primary)
         ax2.set_ylabel('Momentum Score (%)', color=PerformanceColors.EMPHASIS)
@@ -0,0 +1,81 @@
+"""
+FootballViz Compiled Kernels
+
+Optional Numba kernels for per-play hot loops. Numba is not a dependency:
+it is imported on first use, and when it is missing the loaders return None
+so callers keep their NumPy implementation.
+"""
+
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+# Explicit signature so the kernel compiles when loaded, not on the first request
+_CLASSIFY_SIGNATURE = 'Tuple((b1[:], b1[:], i8[:, :]))(i4[:], i4[:], i4[:], i4[:], intp[:], intp, i8, f8[:])'
+
+_classify_plays: Optional[Callable] = None
+_numba_checked = False
+
+
+def _classify_plays_loop(down: np.ndarray, distance: np.ndarray, yards: np.ndarray,
+                         points: np.ndarray, formation_codes: np.ndarray, n_formations: int,
+                         explosive_threshold: int,
+                         thresholds: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Classify plays and total them per formation in a single loop
+    
+    Args:
+        down: Down per play (0 when unknown)
+        distance: Yards to go per play
+        yards: Yards gained per play
+        points: Points scored per play
+        formation_codes: Formation code per play, in ``range(n_formations)``
+        n_formations: Number of formations
+        explosive_threshold: Minimum yards for an explosive play
+        thresholds: Success threshold as a fraction of distance, indexed by down
+    
+    Returns:
+        Success mask, explosive mask and a ``(5, n_formations)`` array of play
+        counts and yards/points/success/explosive totals per formation
+    """
+    n_plays = yards.shape[0]
+    successful = np.empty(n_plays, dtype=np.bool_)
+    explosive = np.empty(n_plays, dtype=np.bool_)
+    totals = np.zeros((5, n_formations), dtype=np.int64)
+    
+    for i in range(n_plays):
+        play_down = down[i]
+        play_yards = yards[i]
+        if 1 <= play_down <= 4:
+            success = play_yards >= distance[i] * thresholds[play_down]
+        else:
+            success = play_yards > 0
+        big_play = play_yards >= explosive_threshold
+        successful[i] = success
+        explosive[i] = big_play
+        
+        code = formation_codes[i]
+        totals[0, code] += 1
+        totals[1, code] += play_yards
+        totals[2, code] += points[i]
+        totals[3, code] += success
+        totals[4, code] += big_play
+    
+    return successful, explosive, totals
+
+
+def load_classify_plays() -> Optional[Callable]:
+    """Return the Numba-compiled play classifier, or None when Numba is unavailable"""
+    global _classify_plays, _numba_checked
+    if not _numba_checked:
+        _numba_checked = True
+        try:
+            import numba
+        except ImportError:
+            return None
+        try:
+            _classify_plays = numba.njit(_CLASSIFY_SIGNATURE, cache=True, nogil=True)(_classify_plays_loop)
+        except Exception:
+            # A Numba version that rejects the signature falls back to NumPy like a missing Numba
+            return None
+    return _classify_plays
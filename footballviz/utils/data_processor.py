@@ -7,14 +7,17 @@ Specialized data processing functions for football analytics:
 - Situational analysis utilities
 """
 
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, List, Any, Optional, Sequence, Tuple, Union
 import numpy as np
-from collections import defaultdict, Counter
 from dataclasses import dataclass
-import statistics
+from operator import itemgetter
+from types import MappingProxyType
+import hashlib
 
+from ._kernels import load_classify_plays
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PlayAnalysis:
     """Container for play-level analysis results"""
     total_plays: int
@@ -26,7 +29,7 @@ class PlayAnalysis:
     turnovers: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EfficiencyMetrics:
     """Container for efficiency calculations"""
     overall_efficiency: float
@@ -36,9 +39,147 @@ class EfficiencyMetrics:
     two_minute_efficiency: float
 
 
+
+def _int_column(plays: Sequence[Dict[str, Any]], key: str, dtype: type, default: int = 0) -> np.ndarray:
+    """
+    Integer column of one play field, reading missing or null values as ``default``
+    
+    Values are read as floats first so fractional or non-numeric input raises
+    ValueError instead of being truncated by the integer conversion.
+    """
+    try:
+        try:
+            values = np.fromiter(map(itemgetter(key), plays), dtype=np.float64, count=len(plays))
+        except KeyError:
+            values = np.fromiter((play.get(key) for play in plays), dtype=np.float64, count=len(plays))
+    except (TypeError, ValueError):
+        raise ValueError(f"Play field {key!r} must be numeric")
+    
+    # Null values read as NaN
+    values[np.isnan(values)] = default
+    if not np.array_equal(values, np.trunc(values)):
+        raise ValueError(f"Play field {key!r} must hold whole numbers")
+    return values.astype(dtype)
+
+
+def _null_mask(plays: Sequence[Dict[str, Any]], key: str) -> np.ndarray:
+    """Mask of plays whose field is present but null (None or NaN); missing fields are not null"""
+    return np.fromiter((value is None or value != value for value in (play.get(key, 0) for play in plays)),
+                       dtype=np.bool_, count=len(plays))
+
+
+def _code_column(plays: Sequence[Dict[str, Any]], key: str) -> Tuple[np.ndarray, List[Any]]:
+    """
+    Encode a categorical play field as integer codes in order of first appearance
+    
+    Returns:
+        Code per play and the distinct values indexed by code; plays missing
+        the field are grouped under 'Unknown'
+    """
+    index: Dict[Any, int] = {}
+    try:
+        codes = np.fromiter((index.setdefault(value, len(index)) for value in map(itemgetter(key), plays)),
+                            dtype=np.intp, count=len(plays))
+    except KeyError:
+        index.clear()
+        codes = np.fromiter((index.setdefault(play.get(key, 'Unknown'), len(index)) for play in plays),
+                            dtype=np.intp, count=len(plays))
+    return codes, list(index)
+
+
+# Below these sizes a masked sum per group beats bincount's setup cost
+_MASKED_SUM_MAX_GROUPS = 4
+_MASKED_SUM_MAX_ROWS = 256
+
+
+def _sum_dtype(values: np.ndarray) -> type:
+    """Accumulator dtype keeping integer and boolean columns integral"""
+    return np.int64 if values.dtype.kind in 'biu' else np.float64
+
+
+def _group_totals(codes: np.ndarray, n_groups: int, *columns: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Count rows and sum each column per group code
+    
+    Args:
+        codes: Group code per row, in ``range(n_groups)``
+        n_groups: Number of groups
+        *columns: Value columns aligned with ``codes``
+        
+    Returns:
+        Per-group row counts followed by one per-group sum array per column
+    """
+    if n_groups <= _MASKED_SUM_MAX_GROUPS and len(codes) <= _MASKED_SUM_MAX_ROWS:
+        masks = [codes == code for code in range(n_groups)]
+        counts = np.array([np.count_nonzero(mask) for mask in masks], dtype=np.int64)
+        return (counts,) + tuple(np.array([column[mask].sum() for mask in masks], dtype=_sum_dtype(column))
+                                 for column in columns)
+    
+    if len(codes) and (codes[1:] >= codes[:-1]).all():
+        # Input arrived sorted by group: each group is one contiguous run, so
+        # reduce the runs sequentially instead of scattering through bincount
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        present = codes[starts]
+        counts = np.zeros(n_groups, dtype=np.int64)
+        counts[present] = np.diff(np.r_[starts, len(codes)])
+        totals = [counts]
+        for column in columns:
+            sums = np.zeros(n_groups, dtype=_sum_dtype(column))
+            sums[present] = np.add.reduceat(column, starts, dtype=sums.dtype)
+            totals.append(sums)
+        return tuple(totals)
+    
+    counts = np.bincount(codes, minlength=n_groups)
+    return (counts,) + tuple(np.bincount(codes, weights=column, minlength=n_groups).astype(_sum_dtype(column))
+                             for column in columns)
+
+
+def _first_appearance_codes(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode values as integer codes numbered in order of first appearance
+    
+    Returns:
+        Code per value and the distinct values indexed by code
+    """
+    uniques, first_index, inverse = np.unique(values, return_index=True, return_inverse=True)
+    order = np.argsort(first_index)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+    return rank[inverse], uniques[order]
+
+
+# Array columns produced by FootballDataProcessor._to_arrays
+_ARRAY_COLUMNS = ('yards', 'down', 'distance', 'distance_null', 'points', 'yard_line', 'formation', 'play_type')
+
+# Key situations reported by _aggregate, in result order
+_SITUATIONS = ('red_zone', 'goal_line', 'third_down', 'fourth_down', 'short_yardage')
+
+# Shared read-only stats for a situation with no qualifying plays
+_EMPTY_SITUATION = MappingProxyType({
+    'attempts': 0,
+    'total_yards': 0,
+    'total_points': 0,
+    'avg_yards': 0,
+    'success_rate': 0,
+    'scoring_rate': 0
+})
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of a processed result whose per-group stats dicts are not shared with the cache"""
+    return {
+        key: {name: dict(stats) for name, stats in value.items()} if isinstance(value, dict) else value
+        for key, value in result.items()
+    }
+
+
 class FootballDataProcessor:
     """
     Main data processing class for football analytics
+    
+    Numeric play fields must hold whole numbers; fractional or non-numeric
+    values such as ``yards_gained=5.5`` raise ValueError rather than being
+    truncated.
     """
     
     # Constants for football analysis
@@ -51,53 +192,220 @@ class FootballDataProcessor:
         3: 1.0,  # 3rd down: 100% of distance
         4: 1.0   # 4th down: 100% of distance
     }
+    # SUCCESS_THRESHOLDS indexed directly by down (index 0 unused)
+    _THRESHOLD_TABLE = (0.0, 0.5, 0.7, 1.0, 1.0)
     
     def __init__(self):
         self.processed_data = {}
+        self._cache: Optional[Tuple[Tuple[bytes, Tuple[Any, ...], Tuple[Any, ...]], Dict[str, Any]]] = None
         
-    def process_play_data(self, plays: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def process_play_data(self, plays: Union[Sequence[Dict[str, Any]], Dict[str, Any]]) -> Dict[str, Any]:
         """
         Process raw play data into analytics-ready format
         
         Args:
-            plays: List of play dictionaries
+            plays: Sequence of play dictionaries, or column arrays from ``_to_arrays``
             
         Returns:
             Processed data dictionary
+            
+        A fractional or non-numeric numeric field raises ValueError naming the field.
         """
         if not plays:
             return self._empty_analysis()
         
-        # Basic aggregations
-        total_plays = len(plays)
-        total_yards = sum(play.get('yards_gained', 0) for play in plays)
-        total_points = sum(play.get('points_scored', 0) for play in plays)
-        avg_yards = total_yards / total_plays if total_plays > 0 else 0
+        if not isinstance(plays, dict):
+            plays = self._to_arrays(plays)
         
-        # Advanced metrics
-        explosive_plays = self._count_explosive_plays(plays)
-        success_rate = self._calculate_success_rate(plays)
+        # Repeat renders of the same plays reuse the last result
+        fingerprint = self._fingerprint(plays)
+        cached = self._cache
+        if cached is not None and cached[0] == fingerprint:
+            return _copy_result(cached[1])
+        
+        result = self._aggregate(plays)
+        self._cache = (fingerprint, result)
+        return _copy_result(result)
+    
+    def _empty_analysis(self) -> Dict[str, Any]:
+        """Return empty analysis structure"""
+        return {
+            'summary': PlayAnalysis(0, 0, 0, 0.0, 0.0, 0, 0),
+            'formations': {},
+            'play_types': {},
+            'down_distance': {},
+            'situational': {}
+        }
+    
+    def _to_arrays(self, plays: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Convert play dictionaries into per-field column arrays
+        
+        Formation and play type are stored as integer codes numbered in order
+        of first appearance, with the distinct values listed under
+        ``formations`` and ``play_types``. Missing or null numeric fields read as 0;
+        ``distance_null`` marks plays whose distance was given as null.
+        
+        Args:
+            plays: Sequence of play dictionaries
+            
+        Returns:
+            Dictionary of column arrays
+        """
+        formation_codes, formations = _code_column(plays, 'formation')
+        play_type_codes, play_types = _code_column(plays, 'play_type')
+        
+        return {
+            'yards': _int_column(plays, 'yards_gained', np.int32),
+            'down': _int_column(plays, 'down', np.int32),
+            'distance': _int_column(plays, 'distance', np.int32),
+            'distance_null': _null_mask(plays, 'distance'),
+            'points': _int_column(plays, 'points_scored', np.int32),
+            'yard_line': _int_column(plays, 'yard_line', np.int32),
+            'formation': formation_codes,
+            'play_type': play_type_codes,
+            'formations': formations,
+            'play_types': play_types
+        }
+    
+    def _fingerprint(self, columns: Dict[str, Any]) -> Tuple[bytes, Tuple[Any, ...], Tuple[Any, ...]]:
+        """Content key for column arrays: a digest of the array bytes plus the category values"""
+        digest = hashlib.blake2b(digest_size=16)
+        for key in _ARRAY_COLUMNS:
+            column = np.ascontiguousarray(columns[key])
+            digest.update(column.dtype.str.encode())
+            digest.update(column)
+        return digest.digest(), tuple(columns['formations']), tuple(columns['play_types'])
+    
+    def _aggregate(self, columns: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compute every play metric from column arrays
+        
+        Args:
+            columns: Column arrays from ``_to_arrays``
+            
+        Returns:
+            Processed data dictionary
+        """
+        yards = columns['yards']
+        down = columns['down']
+        distance = columns['distance']
+        points = columns['points']
+        yard_line = columns['yard_line']
+        
+        formations = columns['formations']
+        
+        # Per-play masks, computed once and shared by every breakdown below.
+        # Downs outside 1-4 (special teams or unknown) succeed on any positive gain
+        has_threshold = (down >= 1) & (down <= 4)
+        classify_plays = load_classify_plays()
+        if classify_plays is not None:
+            successful, explosive, formation_totals = classify_plays(
+                down.astype(np.int32, copy=False), distance.astype(np.int32, copy=False),
+                yards.astype(np.int32, copy=False), points.astype(np.int32, copy=False),
+                columns['formation'].astype(np.intp, copy=False), len(formations),
+                self.EXPLOSIVE_PLAY_THRESHOLD, _SUCCESS_THRESHOLD_LUT
+            )
+        else:
+            thresholds = _SUCCESS_THRESHOLD_LUT[np.where(has_threshold, down, 0)]
+            successful = np.where(has_threshold, yards >= distance * thresholds, yards > 0)
+            explosive = yards >= self.EXPLOSIVE_PLAY_THRESHOLD
+            formation_totals = _group_totals(
+                columns['formation'], len(formations), yards, points, successful, explosive
+            )
+        
+        total_plays = len(yards)
+        total_yards = yards.sum().item()
+        total_points = points.sum().item()
+        rated = has_threshold & (distance != 0)
+        success_rate = float(successful[rated].mean() * 100) if rated.any() else 0.0
         
         # Formation analysis
-        formation_stats = self._analyze_formations(plays)
+        counts, yards_sum, points_sum, success_sum, explosive_sum = formation_totals
+        formation_stats = {}
+        for formation, count, formation_yards, formation_points, formation_successes, formation_explosive in zip(
+                formations, counts.tolist(), yards_sum.tolist(), points_sum.tolist(),
+                success_sum.tolist(), explosive_sum.tolist()):
+            formation_stats[formation] = {
+                'count': count,
+                'total_yards': formation_yards,
+                'total_points': formation_points,
+                'avg_yards': formation_yards / count if count > 0 else 0,
+                'avg_points': formation_points / count if count > 0 else 0,
+                'success_rate': (formation_successes / count * 100) if count > 0 else 0,
+                'explosive_rate': (formation_explosive / count * 100) if count > 0 else 0
+            }
         
         # Play type analysis
-        play_type_stats = self._analyze_play_types(plays)
+        play_types = columns['play_types']
+        counts, yards_sum, points_sum, success_sum = _group_totals(
+            columns['play_type'], len(play_types), yards, points, successful
+        )
+        play_type_stats = {}
+        for play_type, count, type_yards, type_points, type_successes in zip(
+                play_types, counts.tolist(), yards_sum.tolist(), points_sum.tolist(), success_sum.tolist()):
+            play_type_stats[play_type] = {
+                'count': count,
+                'total_yards': type_yards,
+                'avg_yards': type_yards / count if count > 0 else 0,
+                'success_rate': (type_successes / count * 100) if count > 0 else 0,
+                'points_scored': type_points
+            }
         
         # Down and distance analysis
-        down_distance_stats = self._analyze_down_distance(plays)
+        has_down = down != 0
+        down_codes, downs = _first_appearance_codes(down[has_down])
+        down_yards = yards[has_down]
+        # Conversion = gained the required distance
+        counts, yards_sum, success_sum, conversion_sum = _group_totals(
+            down_codes, len(downs), down_yards, successful[has_down], down_yards >= distance[has_down]
+        )
+        down_distance_stats = {}
+        for down_value, count, total_down_yards, down_successes, conversions in zip(
+                downs.tolist(), counts.tolist(), yards_sum.tolist(), success_sum.tolist(), conversion_sum.tolist()):
+            down_distance_stats[f"Down {down_value}"] = {
+                'count': count,
+                'avg_yards': total_down_yards / count if count > 0 else 0,
+                'success_rate': (down_successes / count * 100) if count > 0 else 0,
+                'conversion_rate': (conversions / count * 100) if count > 0 else 0
+            }
         
         # Situational analysis
-        situational_stats = self._analyze_situations(plays)
+        situational_stats = {}
+        situation_masks = np.stack((
+            yard_line >= self.RED_ZONE_START,
+            yard_line >= self.GOAL_LINE_DISTANCE,
+            down == 3,
+            down == 4,
+            # A null distance (e.g. punts) is not short yardage; a missing one reads as 0 and is
+            (distance <= 2) & ~columns['distance_null']
+        ))
+        # [attempts, yards, points, successes] per situation in one product
+        situation_totals = situation_masks.astype(np.int64) @ np.stack(
+            (np.ones_like(yards), yards, points, successful)
+        ).astype(np.int64).T
+        for situation, (attempts, situation_yards, situation_points, situation_successes) in zip(
+                _SITUATIONS, situation_totals.tolist()):
+            if attempts:
+                situational_stats[situation] = {
+                    'attempts': attempts,
+                    'total_yards': situation_yards,
+                    'total_points': situation_points,
+                    'avg_yards': situation_yards / attempts,
+                    'success_rate': (situation_successes / attempts * 100),
+                    'scoring_rate': (situation_points / attempts * 100) if situation_points > 0 else 0
+                }
+            else:
+                situational_stats[situation] = _EMPTY_SITUATION
         
         return {
             'summary': PlayAnalysis(
                 total_plays=total_plays,
                 total_yards=total_yards,
                 total_points=total_points,
-                avg_yards_per_play=avg_yards,
+                avg_yards_per_play=total_yards / total_plays if total_plays > 0 else 0,
                 success_rate=success_rate,
-                explosive_plays=explosive_plays,
+                explosive_plays=int(np.count_nonzero(explosive)),
                 turnovers=0  # Would need to parse from play results
             ),
             'formations': formation_stats,
@@ -106,226 +414,40 @@ class FootballDataProcessor:
             'situational': situational_stats
         }
     
-    def _empty_analysis(self) -> Dict[str, Any]:
-        """Return empty analysis structure"""
-        return {
-            'summary': PlayAnalysis(0, 0, 0, 0.0, 0.0, 0, 0),
-            'formations': {},
-            'play_types': {},
-            'down_distance': {},
-            'situational': {}
-        }
-    
     def _count_explosive_plays(self, plays: List[Dict[str, Any]]) -> int:
         """Count explosive plays (20+ yards)"""
-        return sum(1 for play in plays 
-                  if play.get('yards_gained', 0) >= self.EXPLOSIVE_PLAY_THRESHOLD)
+        return self._aggregate(self._to_arrays(plays))['summary'].explosive_plays
     
     def _calculate_success_rate(self, plays: List[Dict[str, Any]]) -> float:
         """Calculate overall success rate based on down and distance"""
-        successful_plays = 0
-        valid_plays = 0
-        
-        for play in plays:
-            down = play.get('down')
-            distance = play.get('distance')
-            yards_gained = play.get('yards_gained', 0)
-            
-            if down and distance and down in self.SUCCESS_THRESHOLDS:
-                valid_plays += 1
-                success_threshold = distance * self.SUCCESS_THRESHOLDS[down]
-                if yards_gained >= success_threshold:
-                    successful_plays += 1
-        
-        return (successful_plays / valid_plays * 100) if valid_plays > 0 else 0.0
+        return self._aggregate(self._to_arrays(plays))['summary'].success_rate
     
     def _analyze_formations(self, plays: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Analyze performance by formation"""
-        formation_data = defaultdict(lambda: {
-            'count': 0, 
-            'yards': 0, 
-            'points': 0,
-            'successful_plays': 0,
-            'explosive_plays': 0
-        })
-        
-        for play in plays:
-            formation = play.get('formation', 'Unknown')
-            yards = play.get('yards_gained', 0)
-            points = play.get('points_scored', 0)
-            
-            formation_data[formation]['count'] += 1
-            formation_data[formation]['yards'] += yards
-            formation_data[formation]['points'] += points
-            
-            if yards >= self.EXPLOSIVE_PLAY_THRESHOLD:
-                formation_data[formation]['explosive_plays'] += 1
-            
-            # Calculate success (simplified)
-            if self._is_successful_play(play):
-                formation_data[formation]['successful_plays'] += 1
-        
-        # Calculate averages
-        result = {}
-        for formation, stats in formation_data.items():
-            count = stats['count']
-            result[formation] = {
-                'count': count,
-                'total_yards': stats['yards'],
-                'total_points': stats['points'],
-                'avg_yards': stats['yards'] / count if count > 0 else 0,
-                'avg_points': stats['points'] / count if count > 0 else 0,
-                'success_rate': (stats['successful_plays'] / count * 100) if count > 0 else 0,
-                'explosive_rate': (stats['explosive_plays'] / count * 100) if count > 0 else 0
-            }
-        
-        return result
+        return self._aggregate(self._to_arrays(plays))['formations']
     
     def _analyze_play_types(self, plays: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Analyze performance by play type"""
-        play_type_data = defaultdict(lambda: {
-            'count': 0,
-            'yards': 0,
-            'points': 0,
-            'successful_plays': 0
-        })
-        
-        for play in plays:
-            play_type = play.get('play_type', 'Unknown')
-            yards = play.get('yards_gained', 0)
-            points = play.get('points_scored', 0)
-            
-            play_type_data[play_type]['count'] += 1
-            play_type_data[play_type]['yards'] += yards
-            play_type_data[play_type]['points'] += points
-            
-            if self._is_successful_play(play):
-                play_type_data[play_type]['successful_plays'] += 1
-        
-        # Calculate averages and efficiency
-        result = {}
-        for play_type, stats in play_type_data.items():
-            count = stats['count']
-            result[play_type] = {
-                'count': count,
-                'total_yards': stats['yards'],
-                'avg_yards': stats['yards'] / count if count > 0 else 0,
-                'success_rate': (stats['successful_plays'] / count * 100) if count > 0 else 0,
-                'points_scored': stats['points']
-            }
-        
-        return result
+        return self._aggregate(self._to_arrays(plays))['play_types']
     
     def _analyze_down_distance(self, plays: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
         """Analyze performance by down and distance"""
-        down_data = defaultdict(lambda: {
-            'count': 0,
-            'yards': 0,
-            'successful_plays': 0,
-            'conversions': 0
-        })
-        
-        for play in plays:
-            down = play.get('down')
-            if down:
-                down_key = f"Down {down}"
-                yards = play.get('yards_gained', 0)
-                distance = play.get('distance', 0)
-                
-                down_data[down_key]['count'] += 1
-                down_data[down_key]['yards'] += yards
-                
-                if self._is_successful_play(play):
-                    down_data[down_key]['successful_plays'] += 1
-                
-                # Check for conversion (gained required distance)
-                if yards >= distance:
-                    down_data[down_key]['conversions'] += 1
-        
-        # Calculate rates
-        result = {}
-        for down, stats in down_data.items():
-            count = stats['count']
-            result[down] = {
-                'count': count,
-                'avg_yards': stats['yards'] / count if count > 0 else 0,
-                'success_rate': (stats['successful_plays'] / count * 100) if count > 0 else 0,
-                'conversion_rate': (stats['conversions'] / count * 100) if count > 0 else 0
-            }
-        
-        return result
+        return self._aggregate(self._to_arrays(plays))['down_distance']
     
     def _analyze_situations(self, plays: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze performance in key situations"""
-        situations = {
-            'red_zone': [],
-            'goal_line': [],
-            'third_down': [],
-            'fourth_down': [],
-            'short_yardage': []
-        }
-        
-        for play in plays:
-            yard_line = play.get('yard_line', 0)
-            down = play.get('down')
-            distance = play.get('distance', 0)
-            
-            # Categorize situations
-            if yard_line >= self.RED_ZONE_START:
-                situations['red_zone'].append(play)
-            
-            if yard_line >= self.GOAL_LINE_DISTANCE:
-                situations['goal_line'].append(play)
-            
-            if down == 3:
-                situations['third_down'].append(play)
-            
-            if down == 4:
-                situations['fourth_down'].append(play)
-            
-            if distance <= 2:
-                situations['short_yardage'].append(play)
-        
-        # Calculate situational statistics
-        result = {}
-        for situation, situation_plays in situations.items():
-            if situation_plays:
-                total_yards = sum(p.get('yards_gained', 0) for p in situation_plays)
-                total_points = sum(p.get('points_scored', 0) for p in situation_plays)
-                successful = sum(1 for p in situation_plays if self._is_successful_play(p))
-                
-                result[situation] = {
-                    'attempts': len(situation_plays),
-                    'total_yards': total_yards,
-                    'total_points': total_points,
-                    'avg_yards': total_yards / len(situation_plays),
-                    'success_rate': (successful / len(situation_plays) * 100),
-                    'scoring_rate': (total_points / len(situation_plays) * 100) if total_points > 0 else 0
-                }
-            else:
-                result[situation] = {
-                    'attempts': 0,
-                    'total_yards': 0,
-                    'total_points': 0,
-                    'avg_yards': 0,
-                    'success_rate': 0,
-                    'scoring_rate': 0
-                }
-        
-        return result
+        return self._aggregate(self._to_arrays(plays))['situational']
     
     def _is_successful_play(self, play: Dict[str, Any]) -> bool:
         """Determine if a play was successful based on down and distance"""
         down = play.get('down')
-        distance = play.get('distance', 0)
         yards_gained = play.get('yards_gained', 0)
         
-        if not down or down not in self.SUCCESS_THRESHOLDS:
+        if down is None or down < 1 or down > 4:
             # For special teams or unknown situations, use yards gained > 0
             return yards_gained > 0
         
-        success_threshold = distance * self.SUCCESS_THRESHOLDS[down]
-        return yards_gained >= success_threshold
+        return yards_gained >= play.get('distance', 0) * self._THRESHOLD_TABLE[down]
     
     def compare_datasets(self, 
                         data1: Dict[str, Any], 
@@ -387,6 +509,31 @@ class FootballDataProcessor:
         return comparison
 
 
+# Success threshold as a fraction of distance, indexed by down (0 = no down)
+_SUCCESS_THRESHOLD_LUT = np.array(FootballDataProcessor._THRESHOLD_TABLE)
+
+
+def _expected_points(yard_line: float) -> float:
+    """Convert field position to expected points (simplified)"""
+    # Simplified linear model: closer to goal = more expected points
+    if yard_line >= 95:
+        return 6.0  # Goal line = ~6 points
+    elif yard_line >= 80:
+        return 3.0 + (yard_line - 80) / 15 * 3  # Red zone
+    elif yard_line >= 50:
+        return 1.0 + (yard_line - 50) / 30 * 2  # Plus territory
+    else:
+        return 0.5 * (yard_line / 50)  # Minus territory
+
+
+# Expected points for every yard line a play can start or end on: a 0-100
+# starting line plus a gain or loss of up to 100 yards
+_EP_MIN_YARD_LINE = -100
+_EP_MAX_YARD_LINE = 200
+_EP_VALUES = tuple(_expected_points(yard_line) for yard_line in range(_EP_MIN_YARD_LINE, _EP_MAX_YARD_LINE + 1))
+_EP_TABLE = np.array(_EP_VALUES)
+
+
 class EfficiencyCalculator:
     """
     Calculate advanced efficiency metrics for football performance
@@ -403,37 +550,29 @@ class EfficiencyCalculator:
         Returns:
             Average EPA per play
         """
-        # Simplified EPA calculation based on field position and outcomes
-        total_epa = 0
-        valid_plays = 0
+        if not plays:
+            return 0.0
         
-        for play in plays:
-            yard_line = play.get('yard_line', 50)
-            yards_gained = play.get('yards_gained', 0)
-            points_scored = play.get('points_scored', 0)
-            
-            # Simplified expected points based on field position
-            starting_ep = EfficiencyCalculator._field_position_to_ep(yard_line)
-            ending_ep = EfficiencyCalculator._field_position_to_ep(yard_line + yards_gained)
-            
-            play_epa = (ending_ep - starting_ep) + points_scored
-            total_epa += play_epa
-            valid_plays += 1
+        # Simplified EPA calculation based on field position and outcomes
+        yard_line = _int_column(plays, 'yard_line', np.int64, default=50)
+        yards_gained = _int_column(plays, 'yards_gained', np.int64)
+        points_scored = _int_column(plays, 'points_scored', np.int64)
         
-        return total_epa / valid_plays if valid_plays > 0 else 0.0
+        play_epa = (EfficiencyCalculator._field_position_to_ep_vec(yard_line + yards_gained)
+                    - EfficiencyCalculator._field_position_to_ep_vec(yard_line)) + points_scored
+        return float(play_epa.mean())
     
     @staticmethod
     def _field_position_to_ep(yard_line: int) -> float:
         """Convert field position to expected points (simplified)"""
-        # Simplified linear model: closer to goal = more expected points
-        if yard_line >= 95:
-            return 6.0  # Goal line = ~6 points
-        elif yard_line >= 80:
-            return 3.0 + (yard_line - 80) / 15 * 3  # Red zone
-        elif yard_line >= 50:
-            return 1.0 + (yard_line - 50) / 30 * 2  # Plus territory
-        else:
-            return 0.5 * (yard_line / 50)  # Minus territory
+        if type(yard_line) is int and _EP_MIN_YARD_LINE <= yard_line <= _EP_MAX_YARD_LINE:
+            return _EP_VALUES[yard_line - _EP_MIN_YARD_LINE]
+        return _expected_points(yard_line)
+    
+    @staticmethod
+    def _field_position_to_ep_vec(yard_line: np.ndarray) -> np.ndarray:
+        """Vectorized ``_field_position_to_ep`` over an array of integer yard lines"""
+        return _EP_TABLE[np.clip(yard_line, _EP_MIN_YARD_LINE, _EP_MAX_YARD_LINE) - _EP_MIN_YARD_LINE]
     
     @staticmethod
     def calculate_win_probability_impact(plays: List[Dict[str, Any]], 
@@ -449,8 +588,8 @@ class EfficiencyCalculator:
             Win probability metrics
         """
         # Simplified calculation based on points and field position
-        total_points = sum(play.get('points_scored', 0) for play in plays)
-        avg_field_position = np.mean([play.get('yard_line', 50) for play in plays])
+        total_points = _int_column(plays, 'points_scored', np.int64).sum().item()
+        avg_field_position = _int_column(plays, 'yard_line', np.int64, default=50).mean()
         
         # Base win probability from score differential
         base_wp = 50 + (current_score_diff * 2)  # Simplified
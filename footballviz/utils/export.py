@@ -7,19 +7,37 @@ Export and formatting utilities for FootballViz charts:
 - Presentation optimization
 """
 
-import io
+import json
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Union
 from datetime import datetime
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from ..charts.base import ChartExporter
 
+# Upper bound on concurrent chart exports
+_MAX_EXPORT_WORKERS = 8
+
+# Metadata serialization options; like json.dumps, non-str keys are accepted and datetimes rejected
+_ORJSON_METADATA_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME if orjson is not None else 0
+)
+
 
 class ExportManager:
     """
     Centralized export management for FootballViz charts
     """
     
+    # Base output directories already created by any ExportManager in this process
+    _known_dirs: Set[str] = set()
+    
     def __init__(self, output_dir: str = "exports"):
         """
         Initialize export manager
@@ -28,11 +46,22 @@ class ExportManager:
             output_dir: Base directory for exports
         """
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        if output_dir not in ExportManager._known_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            ExportManager._known_dirs.add(output_dir)
+    
+    @staticmethod
+    def _export_chart(chart: Any, filename: str, formats: List[str], preset: str) -> List[str]:
+        """Export one chart, recreating its directory if it was removed after being cached"""
+        try:
+            return ChartExporter.export_chart_formats(chart, filename, formats, preset)
+        except FileNotFoundError:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            return ChartExporter.export_chart_formats(chart, filename, formats, preset)
     
     def export_chart_collection(self, 
                                charts: List[Any],
-                               base_filename: str,
+                               base_filename: Union[str, Path],
                                formats: List[str] = ['png', 'pdf'],
                                preset: str = 'presentation') -> Dict[str, List[str]]:
         """
@@ -40,29 +69,32 @@ class ExportManager:
         
         Args:
             charts: List of FootballChart instances
-            base_filename: Base filename for exports
+            base_filename: Base filename for exports, relative to the output directory
             formats: List of export formats
             preset: Export preset to use
             
         Returns:
             Dictionary mapping formats to exported file paths
         """
-        exported_files = {format_name: [] for format_name in formats}
+        exported_files = {format_name: [None] * len(charts) for format_name in formats}
+        output_dir = Path(self.output_dir)
         
-        for i, chart in enumerate(charts):
-            chart_filename = f"{base_filename}_chart_{i+1}"
-            
-            for format_name in formats:
-                output_path = os.path.join(self.output_dir, f"{chart_filename}.{format_name}")
-                ChartExporter.export_chart(chart, output_path, preset)
-                exported_files[format_name].append(output_path)
+        # One task per chart: a figure must not be saved from two threads at once
+        with ThreadPoolExecutor(max_workers=min(_MAX_EXPORT_WORKERS, len(charts)) or 1) as executor:
+            futures = [executor.submit(self._export_chart, chart,
+                                       str(output_dir / f"{base_filename}_chart_{i+1}"), formats, preset)
+                       for i, chart in enumerate(charts)]
+            for i, future in enumerate(futures):
+                for format_name, filename in zip(formats, future.result()):
+                    exported_files[format_name][i] = filename
         
         return exported_files
     
     def create_report_package(self, 
                             charts: List[Any],
                             metadata: Dict[str, Any],
-                            package_name: str) -> str:
+                            package_name: str,
+                            formats: Optional[List[str]] = None) -> str:
         """
         Create comprehensive report package with charts and metadata
         
@@ -70,32 +102,43 @@ class ExportManager:
             charts: List of FootballChart instances
             metadata: Report metadata
             package_name: Name for the report package
+            formats: Chart export formats (default: png and pdf)
             
         Returns:
             Path to created package
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        package_dir = os.path.join(self.output_dir, f"{package_name}_{timestamp}")
+        if not charts:
+            raise ValueError("No charts to export")
+        
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        package_name = f"{package_name}_{timestamp}"
+        package_dir = Path(self.output_dir) / package_name
         os.makedirs(package_dir, exist_ok=True)
         
         # Export charts
         chart_files = self.export_chart_collection(
             charts, 
-            os.path.join(package_dir, "chart"),
-            formats=['png', 'pdf', 'svg']
+            Path(package_name) / "chart",
+            formats=formats or ['png', 'pdf']
         )
         
         # Create metadata file
-        metadata_file = os.path.join(package_dir, "report_metadata.json")
-        import json
-        with open(metadata_file, 'w') as f:
-            json.dump({
-                **metadata,
-                'generated_at': datetime.now().isoformat(),
-                'chart_files': chart_files
-            }, f, indent=2)
-        
-        return package_dir
+        metadata_file = package_dir / "report_metadata.json"
+        report_metadata = {
+            **metadata,
+            'generated_at': now.isoformat(),
+            'chart_files': chart_files
+        }
+        # Serialize before opening the file so a rejected payload leaves no empty file behind
+        if orjson is not None:
+            payload = orjson.dumps(report_metadata, option=_ORJSON_METADATA_OPTIONS)
+        else:
+            payload = json.dumps(report_metadata, indent=2).encode('utf-8')
+        with open(metadata_file, 'wb') as f:
+            f.write(payload)
+        
+        return str(package_dir)
 
 
 class ReportGenerator:
@@ -112,19 +155,56 @@ class ReportGenerator:
         """
         self.theme_manager = theme_manager
         self.export_manager = ExportManager()
+        self._theme_name_cache = None
+        self._executor = ThreadPoolExecutor(max_workers=2)
+    
+    @property
+    def _theme_name(self) -> str:
+        """Name of the current theme, re-read only when the theme object changes"""
+        if not self.theme_manager:
+            return 'default'
+        
+        current_theme = self.theme_manager.current_theme
+        if self._theme_name_cache is None or self._theme_name_cache[0] is not current_theme:
+            self._theme_name_cache = (current_theme, current_theme.theme_name)
+        return self._theme_name_cache[1]
+    
+    def invalidate_theme_cache(self):
+        """Drop the cached theme name, e.g. after renaming the current theme"""
+        self._theme_name_cache = None
+    
+    def close(self):
+        """Wait for pending background exports and shut down the export thread pool"""
+        self._executor.shutdown(wait=True)
+    
+    def _create_package(self,
+                        charts: List[Any],
+                        metadata: Dict[str, Any],
+                        report_name: str,
+                        formats: Optional[List[str]],
+                        async_export: bool) -> Union[str, Future]:
+        """Create the report package now, or on the export thread pool when async_export is set"""
+        if async_export:
+            return self._executor.submit(self.export_manager.create_report_package,
+                                         charts, metadata, report_name, formats)
+        return self.export_manager.create_report_package(charts, metadata, report_name, formats=formats)
     
     def generate_game_summary_report(self, 
                                    game_data: Dict[str, Any],
-                                   charts: List[Any]) -> str:
+                                   charts: List[Any],
+                                   formats: Optional[List[str]] = None,
+                                   async_export: bool = False) -> Union[str, Future]:
         """
         Generate comprehensive game summary report
         
         Args:
             game_data: Game information and statistics
             charts: List of FootballChart instances
+            formats: Chart export formats (default: png and pdf)
+            async_export: Export on a background thread and return a Future
             
         Returns:
-            Path to generated report
+            Path to generated report, or a Future resolving to it when async_export is set
         """
         report_name = f"game_summary_{game_data.get('week', 'unknown')}_vs_{game_data.get('opponent', 'unknown').replace(' ', '_')}"
         
@@ -132,23 +212,27 @@ class ReportGenerator:
             'report_type': 'game_summary',
             'game_info': game_data,
             'charts_included': len(charts),
-            'theme': self.theme_manager.current_theme.theme_name if self.theme_manager else 'default'
+            'theme': self._theme_name
         }
         
-        return self.export_manager.create_report_package(charts, metadata, report_name)
+        return self._create_package(charts, metadata, report_name, formats, async_export)
     
     def generate_season_analysis_report(self,
                                       season_data: Dict[str, Any],
-                                      charts: List[Any]) -> str:
+                                      charts: List[Any],
+                                      formats: Optional[List[str]] = None,
+                                      async_export: bool = False) -> Union[str, Future]:
         """
         Generate season analysis report
         
         Args:
             season_data: Season statistics and information
             charts: List of FootballChart instances
+            formats: Chart export formats (default: png and pdf)
+            async_export: Export on a background thread and return a Future
             
         Returns:
-            Path to generated report
+            Path to generated report, or a Future resolving to it when async_export is set
         """
         report_name = f"season_analysis_{season_data.get('year', 'unknown')}"
         
@@ -156,23 +240,27 @@ class ReportGenerator:
             'report_type': 'season_analysis',
             'season_info': season_data,
             'charts_included': len(charts),
-            'theme': self.theme_manager.current_theme.theme_name if self.theme_manager else 'default'
+            'theme': self._theme_name
         }
         
-        return self.export_manager.create_report_package(charts, metadata, report_name)
+        return self._create_package(charts, metadata, report_name, formats, async_export)
     
     def generate_comparison_report(self,
                                  comparison_data: Dict[str, Any],
-                                 charts: List[Any]) -> str:
+                                 charts: List[Any],
+                                 formats: Optional[List[str]] = None,
+                                 async_export: bool = False) -> Union[str, Future]:
         """
         Generate team/game comparison report
         
         Args:
             comparison_data: Comparison analysis data
             charts: List of FootballChart instances
+            formats: Chart export formats (default: png and pdf)
+            async_export: Export on a background thread and return a Future
             
         Returns:
-            Path to generated report
+            Path to generated report, or a Future resolving to it when async_export is set
         """
         report_name = f"comparison_{comparison_data.get('comparison_type', 'unknown')}"
         
@@ -180,7 +268,7 @@ class ReportGenerator:
             'report_type': 'comparison',
             'comparison_info': comparison_data,
             'charts_included': len(charts),
-            'theme': self.theme_manager.current_theme.theme_name if self.theme_manager else 'default'
+            'theme': self._theme_name
         }
         
-        return self.export_manager.create_report_package(charts, metadata, report_name)
\ No newline at end of file
+        return self._create_package(charts, metadata, report_name, formats, async_export)
\ No newline at end of file
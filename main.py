@@ -571,6 +571,9 @@ def get_team_games(team_id):
     except Exception as e:
         return jsonify({'message': str(e)}), 500
 
+# Down labels for downs 1-4, indexed by down; other downs are formatted on demand
+_DOWN_LABELS = (None, "Down 1", "Down 2", "Down 3", "Down 4")
+
 @app.route('/api/consultant/analytics/<int:game_id>', methods=['GET'])
 @jwt_required()
 def get_game_analytics(game_id):
@@ -592,46 +595,40 @@ def get_game_analytics(game_id):
         total_yards = sum(play.yards_gained for play in plays)
         total_points = sum(play.points_scored for play in plays)
         
-        # Group by play type
-        play_type_stats = {}
+        # Group by play type, formation and down as [count, yards] counters
+        play_type_totals = {}
+        formation_totals = {}
+        down_totals = {}
         for play in plays:
-            play_type = play.play_type
-            if play_type not in play_type_stats:
-                play_type_stats[play_type] = {'count': 0, 'yards': 0, 'avg_yards': 0}
-            play_type_stats[play_type]['count'] += 1
-            play_type_stats[play_type]['yards'] += play.yards_gained
-        
-        # Calculate averages
-        for play_type in play_type_stats:
-            stats = play_type_stats[play_type]
-            stats['avg_yards'] = round(stats['yards'] / stats['count'], 2) if stats['count'] > 0 else 0
-        
-        # Group by formation
-        formation_stats = {}
-        for play in plays:
-            formation = play.formation
-            if formation not in formation_stats:
-                formation_stats[formation] = {'count': 0, 'yards': 0, 'avg_yards': 0}
-            formation_stats[formation]['count'] += 1
-            formation_stats[formation]['yards'] += play.yards_gained
+            yards = play.yards_gained
+            
+            totals = play_type_totals.get(play.play_type)
+            if totals is None:
+                totals = play_type_totals[play.play_type] = [0, 0]
+            totals[0] += 1
+            totals[1] += yards
+            
+            totals = formation_totals.get(play.formation)
+            if totals is None:
+                totals = formation_totals[play.formation] = [0, 0]
+            totals[0] += 1
+            totals[1] += yards
+            
+            down = _DOWN_LABELS[play.down] if play.down in (1, 2, 3, 4) else f"Down {play.down}"
+            totals = down_totals.get(down)
+            if totals is None:
+                totals = down_totals[down] = [0, 0]
+            totals[0] += 1
+            totals[1] += yards
         
         # Calculate averages
-        for formation in formation_stats:
-            stats = formation_stats[formation]
-            stats['avg_yards'] = round(stats['yards'] / stats['count'], 2) if stats['count'] > 0 else 0
-        
-        # Down and distance analysis
-        down_stats = {}
-        for play in plays:
-            down = f"Down {play.down}"
-            if down not in down_stats:
-                down_stats[down] = {'count': 0, 'yards': 0, 'avg_yards': 0}
-            down_stats[down]['count'] += 1
-            down_stats[down]['yards'] += play.yards_gained
-        
-        for down in down_stats:
-            stats = down_stats[down]
-            stats['avg_yards'] = round(stats['yards'] / stats['count'], 2) if stats['count'] > 0 else 0
+        play_type_stats, formation_stats, down_stats = (
+            {
+                key: {'count': count, 'yards': yards, 'avg_yards': round(yards / count, 2) if count > 0 else 0}
+                for key, (count, yards) in group_totals.items()
+            }
+            for group_totals in (play_type_totals, formation_totals, down_totals)
+        )
         
         return jsonify({
             'game': game_schema.dump(game),
@@ -3,6 +3,7 @@
 Add test game data for the test team
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from datetime import datetime
 
@@ -51,10 +52,13 @@ def add_test_data():
     print("🏈 Adding test game data for LangChain testing...")
     print("=" * 50)
     
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    
     try:
         # Login to get token
         print("\n🔑 Logging in...")
-        login_response = requests.post(f"{BASE_URL}/auth/team/login", json={
+        login_response = session.post(f"{BASE_URL}/auth/team/login", json={
             'email': 'test@eagles.com',
             'password': 'password123'
         })
@@ -64,7 +68,7 @@ def add_test_data():
             return False
         
         token = login_response.json()['access_token']
-        headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
+        session.headers.update({'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'})
         print("✅ Login successful")
         
         # Create game data
@@ -76,7 +80,7 @@ def add_test_data():
         }
         
         print("\n📊 Creating test game...")
-        game_response = requests.post(f"{BASE_URL}/games", json=game_data, headers=headers)
+        game_response = session.post(f"{BASE_URL}/games", json=game_data)
         
         if game_response.status_code != 201:
             print(f"❌ Game creation failed: {game_response.text}")
@@ -88,19 +92,14 @@ def add_test_data():
         # Add play data
         print(f"\n🎯 Adding {len(sample_plays)} sample plays...")
         
-        for i, play in enumerate(sample_plays, 1):
-            play_data = {
-                'game_id': game_id,
-                'plays_data': [play]
-            }
-            
-            play_response = requests.post(f"{BASE_URL}/games/{game_id}/plays", 
-                                        json=play_data, headers=headers)
-            
-            if play_response.status_code == 201:
-                print(f"  ✅ Play {i}/{len(sample_plays)} added")
-            else:
-                print(f"  ❌ Play {i} failed: {play_response.text}")
+        play_response = session.post(f"{BASE_URL}/games/{game_id}/plays",
+                                     json={'game_id': game_id, 'plays_data': sample_plays})
+        
+        if play_response.status_code != 201:
+            print(f"❌ Adding plays failed: {play_response.text}")
+            return False
+        
+        print(f"✅ Added {len(sample_plays)} plays")
         
         print("\n" + "=" * 50)
         print("🎉 Test data successfully added!")
@@ -128,6 +127,8 @@ def add_test_data():
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
+    finally:
+        session.close()
 
 if __name__ == "__main__":
     add_test_data()
\ No newline at end of file
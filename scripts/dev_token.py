@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Cache the test team's JWT between dev script runs
+"""
+import base64
+import json
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+TOKEN_CACHE_PATH = os.path.expanduser("~/.cache/football_dev_token.json")
+
+# Log in again once the cached token is this close to expiring
+REFRESH_MARGIN_SECONDS = 60
+
+def _token_expiry(token):
+    """Read the exp claim from a JWT payload without verifying the signature"""
+    payload = token.split('.')[1]
+    payload += '=' * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload)).get('exp', 0)
+
+def _read_cached_token(base_url, email):
+    """Return the cached token for email on base_url if it is not about to expire"""
+    try:
+        with open(TOKEN_CACHE_PATH) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if (cached.get('base_url') == base_url and cached.get('email') == email
+            and cached.get('exp', 0) - REFRESH_MARGIN_SECONDS > time.time()):
+        return cached.get('access_token')
+    return None
+
+def invalidate_cached_token():
+    """Drop the cached token, e.g. after the server rejected it"""
+    try:
+        os.remove(TOKEN_CACHE_PATH)
+    except FileNotFoundError:
+        pass
+
+def load_or_refresh_token(session, base_url, email, password, force_refresh=False):
+    """
+    Return a valid access token, logging in only when the cached one is missing or stale
+    
+    Args:
+        session: requests.Session used for the login request
+        base_url: API base URL; cached tokens are only reused for the same server
+        email: Test team email
+        password: Test team password
+        force_refresh: Log in even if a cached token looks valid (use after a 401)
+    
+    Returns:
+        JWT access token
+    """
+    if force_refresh:
+        invalidate_cached_token()
+    else:
+        token = _read_cached_token(base_url, email)
+        if token:
+            return token
+    
+    os.makedirs(os.path.dirname(TOKEN_CACHE_PATH), exist_ok=True)
+    with open(TOKEN_CACHE_PATH + '.lock', 'w') as lock_file:
+        # Serialize refreshes so concurrent runs don't all hit the login endpoint
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        
+        # Another run may have logged in while we waited for the lock
+        token = _read_cached_token(base_url, email)
+        if token:
+            return token
+        
+        response = session.post(f"{base_url}/auth/team/login", json={
+            'email': email,
+            'password': password
+        })
+        response.raise_for_status()
+        token = response.json()['access_token']
+        
+        temp_path = f"{TOKEN_CACHE_PATH}.{os.getpid()}.tmp"
+        # The token is a credential: create the file owner-only rather than with the umask default
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'base_url': base_url, 'email': email, 'access_token': token,
+                       'exp': _token_expiry(token)}, f)
+        os.replace(temp_path, TOKEN_CACHE_PATH)
+    
+    return token
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+import os
+
 from app import app
 
 if __name__ == '__main__':
@@ -8,5 +10,8 @@ if __name__ == '__main__':
         db.create_all()
         print("Database initialized successfully")
     
+    # Set FLASK_DEBUG=1 to opt back into the Werkzeug debugger
+    debug = os.environ.get('FLASK_DEBUG', '0') == '1'
+    
     print("Starting Flask server on http://0.0.0.0:5001")
-    app.run(debug=True, host='0.0.0.0', port=5001, use_reloader=False)
\ No newline at end of file
+    app.run(debug=debug, threaded=True, host='0.0.0.0', port=5001, use_reloader=False)
\ No newline at end of file
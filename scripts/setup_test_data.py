@@ -2,13 +2,53 @@
 """
 Setup test data for LangChain Assistant
 """
+import os
+import sys
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
 BASE_URL = "http://localhost:5001/api"
 
+# Repository root, where main.py defines the Flask app and models
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Minimum bcrypt cost; only ever used for the throwaway test account
+TEST_BCRYPT_ROUNDS = 4
+
+def create_team_directly(test_team):
+    """
+    Insert the test team straight into the database, skipping the register endpoint's bcrypt cost
+    
+    Args:
+        test_team: Team registration fields (team_name, email, password)
+    
+    Returns:
+        True if the team was inserted, False if it already existed
+    """
+    import bcrypt
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    from main import app, db, Team
+    
+    with app.app_context():
+        if Team.query.filter_by(email=test_team['email']).first():
+            print("📝 Test team already exists")
+            return False
+        
+        password_hash = bcrypt.hashpw(test_team['password'].encode('utf-8'),
+                                      bcrypt.gensalt(rounds=TEST_BCRYPT_ROUNDS)).decode('utf-8')
+        db.session.add(Team(
+            team_name=test_team['team_name'],
+            email=test_team['email'],
+            password_hash=password_hash
+        ))
+        db.session.commit()
+        print("✅ Test team created successfully")
+        return True
+
 def setup_test_data():
-    """Create test team and upload sample data"""
+    """Create test team and upload sample data (set DIRECT_DB=1 to insert the team without HTTP)"""
     
     # Test team data
     test_team = {
@@ -22,21 +62,27 @@ def setup_test_data():
     print("🏈 Setting up test data for LangChain Assistant")
     print("=" * 50)
     
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    
     try:
         # Create test team
         print("\n📊 Creating test team...")
-        response = requests.post(f"{BASE_URL}/auth/team/register", json=test_team)
-        if response.status_code == 201:
-            print("✅ Test team created successfully")
-        elif response.status_code == 409:
-            print("📝 Test team already exists")
+        if os.environ.get('DIRECT_DB'):
+            create_team_directly(test_team)
         else:
-            print(f"❌ Failed to create team: {response.text}")
-            return False
+            response = session.post(f"{BASE_URL}/auth/team/register", json=test_team)
+            if response.status_code == 201:
+                print("✅ Test team created successfully")
+            elif response.status_code == 409:
+                print("📝 Test team already exists")
+            else:
+                print(f"❌ Failed to create team: {response.text}")
+                return False
         
         # Login to get token
         print("\n🔑 Logging in...")
-        login_response = requests.post(f"{BASE_URL}/auth/team/login", json={
+        login_response = session.post(f"{BASE_URL}/auth/team/login", json={
             'email': test_team['email'],
             'password': test_team['password']
         })
@@ -46,12 +92,12 @@ def setup_test_data():
             return False
         
         token = login_response.json()['access_token']
-        headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
+        session.headers.update({'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'})
         
         print("✅ Login successful")
         
         # Check if we have games
-        games_response = requests.get(f"{BASE_URL}/games", headers=headers)
+        games_response = session.get(f"{BASE_URL}/games")
         if games_response.status_code == 200:
             games = games_response.json()['games']
             print(f"\n📋 Found {len(games)} existing games")
@@ -66,16 +112,15 @@ def setup_test_data():
         print("\n🤖 Testing LangChain endpoints...")
         
         # Test status
-        status_response = requests.get(f"{BASE_URL}/langchain/status", headers=headers)
+        status_response = session.get(f"{BASE_URL}/langchain/status")
         if status_response.status_code == 200:
             print("✅ LangChain status endpoint working")
         else:
             print(f"❌ LangChain status failed: {status_response.text}")
         
         # Test translation
-        translate_response = requests.post(f"{BASE_URL}/langchain/translate", 
-                                         json={'query': 'show me red zone plays'}, 
-                                         headers=headers)
+        translate_response = session.post(f"{BASE_URL}/langchain/translate", 
+                                        json={'query': 'show me red zone plays'})
         if translate_response.status_code == 200:
             print("✅ LangChain translate endpoint working")
         else:
@@ -101,6 +146,8 @@ def setup_test_data():
     except Exception as e:
         print(f"❌ Error: {e}")
         return False
+    finally:
+        session.close()
 
 if __name__ == "__main__":
     setup_test_data()
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""
+Shared pytest setup: select the headless matplotlib backend before any test imports pyplot
+"""
+import matplotlib
+
+matplotlib.use("Agg")
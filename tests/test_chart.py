@@ -2,9 +2,7 @@
 
 """Test script for statistical chart generation"""
 
-import sys
-import os
-sys.path.append('.')
+import pandas as pd
 
 from footballviz.charts.statistical import create_statistical_chart
 
@@ -22,28 +20,19 @@ test_plays = [
      'play_type': 'Run', 'yards_gained': 0, 'points_scored': 0, 'unit': 'O'},
 ]
 
+# Build the frame once; both chart types share its columns
+test_df = pd.DataFrame(test_plays)
+
 def test_chart_generation():
     """Test chart generation"""
-    try:
-        print("Testing chart generation...")
-        
-        # Test distribution chart
-        chart_data = create_statistical_chart('distribution', test_plays)
-        print(f"✅ Distribution chart generated, length: {len(chart_data)} characters")
-        
-        # Test formation comparison
-        chart_data = create_statistical_chart('formation_comparison', test_plays)
-        print(f"✅ Formation comparison chart generated, length: {len(chart_data)} characters")
-        
-        print("✅ All tests passed!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
-
-if __name__ == "__main__":
-    success = test_chart_generation()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    print("Testing chart generation...")
+    
+    # Test distribution chart
+    chart_data = create_statistical_chart('distribution', test_df)
+    assert chart_data
+    print(f"✅ Distribution chart generated, length: {len(chart_data)} characters")
+    
+    # Test formation comparison
+    chart_data = create_statistical_chart('formation_comparison', test_df)
+    assert chart_data
+    print(f"✅ Formation comparison chart generated, length: {len(chart_data)} characters")
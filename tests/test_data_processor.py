@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+"""Regression test pinning FootballDataProcessor output on a fixed play list"""
+
+import pytest
+
+from footballviz.utils.data_processor import FootballDataProcessor, PlayAnalysis
+
+# Every down 1-4, a punt with null down/distance, and a play missing formation and points
+PLAYS = [
+    {'down': 1, 'distance': 10, 'yard_line': 25, 'formation': 'Shotgun', 'play_type': 'Pass', 'yards_gained': 6, 'points_scored': 0},
+    {'down': 2, 'distance': 4, 'yard_line': 31, 'formation': 'I-Formation', 'play_type': 'Run', 'yards_gained': 2, 'points_scored': 0},
+    {'down': 3, 'distance': 2, 'yard_line': 82, 'formation': 'Shotgun', 'play_type': 'Pass', 'yards_gained': 22, 'points_scored': 0},
+    {'down': 4, 'distance': 1, 'yard_line': 96, 'formation': 'I-Formation', 'play_type': 'Run', 'yards_gained': 4, 'points_scored': 6},
+    {'down': 1, 'distance': 10, 'yard_line': 40, 'formation': 'Shotgun', 'play_type': 'Run', 'yards_gained': -3, 'points_scored': 0},
+    {'down': None, 'distance': None, 'yard_line': 35, 'formation': 'Punt', 'play_type': 'Punt', 'yards_gained': 0, 'points_scored': 0},
+    {'down': 3, 'distance': 8, 'yard_line': 55, 'play_type': 'Pass', 'yards_gained': 9},
+]
+
+# Matches the original per-play implementation except on the punt, whose null distance
+# made the original raise TypeError; null distances are now left out of short yardage
+EXPECTED = {
+    'summary': PlayAnalysis(total_plays=7, total_yards=40, total_points=6, avg_yards_per_play=40 / 7,
+                            success_rate=4 / 6 * 100, explosive_plays=1, turnovers=0),
+    'formations': {
+        'Shotgun': {'count': 3, 'total_yards': 25, 'total_points': 0, 'avg_yards': 25 / 3, 'avg_points': 0.0,
+                    'success_rate': 2 / 3 * 100, 'explosive_rate': 1 / 3 * 100},
+        'I-Formation': {'count': 2, 'total_yards': 6, 'total_points': 6, 'avg_yards': 3.0, 'avg_points': 3.0,
+                        'success_rate': 50.0, 'explosive_rate': 0.0},
+        'Punt': {'count': 1, 'total_yards': 0, 'total_points': 0, 'avg_yards': 0.0, 'avg_points': 0.0,
+                 'success_rate': 0.0, 'explosive_rate': 0.0},
+        'Unknown': {'count': 1, 'total_yards': 9, 'total_points': 0, 'avg_yards': 9.0, 'avg_points': 0.0,
+                    'success_rate': 100.0, 'explosive_rate': 0.0},
+    },
+    'play_types': {
+        'Pass': {'count': 3, 'total_yards': 37, 'avg_yards': 37 / 3, 'success_rate': 100.0, 'points_scored': 0},
+        'Run': {'count': 3, 'total_yards': 3, 'avg_yards': 1.0, 'success_rate': 1 / 3 * 100, 'points_scored': 6},
+        'Punt': {'count': 1, 'total_yards': 0, 'avg_yards': 0.0, 'success_rate': 0.0, 'points_scored': 0},
+    },
+    'down_distance': {
+        'Down 1': {'count': 2, 'avg_yards': 1.5, 'success_rate': 50.0, 'conversion_rate': 0.0},
+        'Down 2': {'count': 1, 'avg_yards': 2.0, 'success_rate': 0.0, 'conversion_rate': 0.0},
+        'Down 3': {'count': 2, 'avg_yards': 15.5, 'success_rate': 100.0, 'conversion_rate': 100.0},
+        'Down 4': {'count': 1, 'avg_yards': 4.0, 'success_rate': 100.0, 'conversion_rate': 100.0},
+    },
+    'situational': {
+        'red_zone': {'attempts': 2, 'total_yards': 26, 'total_points': 6, 'avg_yards': 13.0,
+                     'success_rate': 100.0, 'scoring_rate': 300.0},
+        'goal_line': {'attempts': 1, 'total_yards': 4, 'total_points': 6, 'avg_yards': 4.0,
+                      'success_rate': 100.0, 'scoring_rate': 600.0},
+        'third_down': {'attempts': 2, 'total_yards': 31, 'total_points': 0, 'avg_yards': 15.5,
+                       'success_rate': 100.0, 'scoring_rate': 0},
+        'fourth_down': {'attempts': 1, 'total_yards': 4, 'total_points': 6, 'avg_yards': 4.0,
+                        'success_rate': 100.0, 'scoring_rate': 600.0},
+        'short_yardage': {'attempts': 2, 'total_yards': 26, 'total_points': 6, 'avg_yards': 13.0,
+                          'success_rate': 100.0, 'scoring_rate': 300.0},
+    },
+}
+
+def test_process_play_data_matches_pinned_output():
+    assert FootballDataProcessor().process_play_data(PLAYS) == EXPECTED
+
+@pytest.mark.parametrize('yards', [5.5, 'five'])
+def test_process_play_data_rejects_non_integer_yardage(yards):
+    plays = [dict(PLAYS[0], yards_gained=yards)]
+    with pytest.raises(ValueError, match='yards_gained'):
+        FootballDataProcessor().process_play_data(plays)
+
+def test_process_play_data_accepts_tuples():
+    assert FootballDataProcessor().process_play_data(tuple(PLAYS)) == EXPECTED
+
+def test_missing_distance_counts_as_short_yardage():
+    plays = [{'down': 3, 'yard_line': 50, 'yards_gained': 1}, {'down': 3, 'distance': None, 'yard_line': 50}]
+    assert FootballDataProcessor().process_play_data(plays)['situational']['short_yardage']['attempts'] == 1
+
+def test_large_point_totals_do_not_wrap():
+    plays = [dict(PLAYS[0], points_scored=200)]
+    assert FootballDataProcessor().process_play_data(plays)['summary'].total_points == 200
+
+def test_cached_result_is_not_shared_with_callers():
+    processor = FootballDataProcessor()
+    first = processor.process_play_data(PLAYS)
+    first['formations']['Shotgun']['count'] = 99
+    first['situational']['red_zone'].clear()
+    first['down_distance'].pop('Down 1')
+    
+    assert processor.process_play_data(PLAYS) == EXPECTED
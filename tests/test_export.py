@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+"""Test chart exports and report metadata serialization with and without orjson"""
+
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from footballviz.charts.bar_charts import EnhancedBarChart
+from footballviz.utils import export
+from footballviz.utils.export import ExportManager
+
+METADATA = {'game_data': {1: {'opponent': 'Test Hawks', 'week': 1}}, 'title': 'Week 1'}
+
+def _write_package(tmp_path):
+    chart = EnhancedBarChart(title='Yards')
+    chart.plot({'Run': 4, 'Pass': 8})
+    package_dir = ExportManager(str(tmp_path)).create_report_package([chart], METADATA, 'pkg', formats=['svg'])
+    with open(os.path.join(package_dir, 'report_metadata.json')) as f:
+        return json.load(f)
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_report_metadata_accepts_int_keys(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(export, 'orjson', None)
+    
+    written = _write_package(tmp_path)
+    
+    assert written['game_data'] == {'1': {'opponent': 'Test Hawks', 'week': 1}}
+    assert written['title'] == 'Week 1'
+    assert len(written['chart_files']['svg']) == 1
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_report_metadata_rejects_datetimes(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip('orjson')
+    else:
+        monkeypatch.setattr(export, 'orjson', None)
+    
+    chart = EnhancedBarChart(title='Yards')
+    chart.plot({'Run': 4, 'Pass': 8})
+    with pytest.raises(TypeError):
+        ExportManager(str(tmp_path)).create_report_package([chart], {'kickoff': datetime(2024, 9, 1, 13)}, 'pkg',
+                                                            formats=['svg'])
+
+def test_export_recreates_removed_output_dir(tmp_path):
+    output_dir = tmp_path / 'exports'
+    manager = ExportManager(str(output_dir))
+    os.rmdir(output_dir)
+    
+    chart = EnhancedBarChart(title='Yards')
+    chart.plot({'Run': 4, 'Pass': 8})
+    exported = manager.export_chart_collection([chart], 'game', formats=['svg'])
+    
+    assert os.path.exists(exported['svg'][0])
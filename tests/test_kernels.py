@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+"""Test that the Numba play classifier kernel matches the NumPy path"""
+
+import random
+
+from footballviz.utils import _kernels, data_processor
+from footballviz.utils.data_processor import FootballDataProcessor
+
+def _random_plays(count, seed=0):
+    rng = random.Random(seed)
+    formations = ['Shotgun', 'I-Formation', 'Singleback', 'Pistol', None]
+    return [{
+        'play_id': i,
+        'down': rng.randint(0, 5),
+        'distance': rng.randint(0, 15),
+        'yard_line': rng.randint(1, 99),
+        'formation': rng.choice(formations),
+        'play_type': rng.choice(['Run', 'Pass', 'Punt']),
+        'yards_gained': rng.randint(-10, 60),
+        'points_scored': rng.choice([0, 0, 0, 2, 3, 6, 7])
+    } for i in range(count)]
+
+def test_classify_plays_loop_matches_numpy(monkeypatch):
+    """Run the kernel as plain Python so it is covered without Numba installed"""
+    plays = _random_plays(300)
+    
+    monkeypatch.setattr(data_processor, 'load_classify_plays', lambda: None)
+    expected = FootballDataProcessor().process_play_data(plays)
+    
+    monkeypatch.setattr(data_processor, 'load_classify_plays', lambda: _kernels._classify_plays_loop)
+    actual = FootballDataProcessor().process_play_data(plays)
+    
+    assert actual == expected
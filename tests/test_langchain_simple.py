@@ -4,60 +4,59 @@
 Simple test to verify LangChain natural language query translation works correctly
 """
 
-import sys
-sys.path.append('.')
+import pytest
 
-from nl_query_translator import FootballQueryTranslator
+from app.services.langchain_service import langchain_service
+from app.services.nl_query_translator import FootballQueryTranslator
 from langchain_ollama import OllamaLLM
 
 def test_natural_language_translation():
     """Test the natural language translation functionality"""
+    if not langchain_service.is_available():
+        pytest.skip("Ollama not available")
+    
     print("🏈 Testing Football Query Translation...")
     
-    try:
-        # Initialize LLM
-        llm = OllamaLLM(base_url="http://localhost:11434", model="llama3.2:1b", temperature=0.3)
-        
-        # Initialize translator
-        translator = FootballQueryTranslator(llm)
-        
-        # Test queries
-        test_queries = [
-            "show me red zone plays",
-            "third down conversions",
-            "running plays for more than 5 yards",
-            "shotgun formation passes",
-            "big plays over 15 yards"
-        ]
-        
-        print(f"\n✅ Testing {len(test_queries)} queries...\n")
-        
-        for i, query in enumerate(test_queries, 1):
-            print(f"Query {i}: '{query}'")
-            result = translator.translate_query(query)
-            
-            if result.success:
-                print(f"  ✅ SUCCESS - Confidence: {result.confidence_score:.2f}")
-                print(f"  📋 Conditions: {len(result.filters['conditions'])} filter(s)")
-                for condition in result.filters['conditions']:
-                    print(f"    - {condition['field']} {condition['operator']} {condition['value']}")
-            else:
-                print(f"  ❌ FAILED: {result.error_message}")
-            print()
-        
-        # Test difficulty analysis
-        print("🎯 Testing difficulty analysis...")
-        for query in test_queries[:2]:
-            analysis = translator.analyze_query_difficulty(query)
-            print(f"'{query}' -> Difficulty: {analysis['difficulty']} (score: {analysis['complexity_score']:.2f})")
-        
-        print("\n🎉 Natural language translation test completed!")
-        return True
+    # Initialize LLM
+    llm = OllamaLLM(base_url="http://localhost:11434", model="llama3.2:1b", temperature=0.3)
+    
+    # Initialize translator
+    translator = FootballQueryTranslator(llm)
+    
+    # Test queries; every one of these is answered by the pattern matcher
+    test_queries = [
+        "show me red zone plays",
+        "third down conversions",
+        "running plays for more than 5 yards",
+        "shotgun formation passes",
+        "big plays over 15 yards"
+    ]
+    
+    print(f"\n✅ Testing {len(test_queries)} queries...\n")
+    
+    # One LLM round-trip for every query the pattern matcher can't answer
+    results = translator.translate_queries_batch(test_queries)
+    assert len(results) == len(test_queries)
+    
+    for i, (query, result) in enumerate(zip(test_queries, results), 1):
+        print(f"Query {i}: '{query}'")
         
-    except Exception as e:
-        print(f"❌ Test failed with error: {str(e)}")
-        return False
-
-if __name__ == "__main__":
-    success = test_natural_language_translation()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+        if result.success:
+            print(f"  ✅ SUCCESS - Confidence: {result.confidence_score:.2f}")
+            print(f"  📋 Conditions: {len(result.filters['conditions'])} filter(s)")
+            for condition in result.filters['conditions']:
+                print(f"    - {condition['field']} {condition['operator']} {condition['value']}")
+        else:
+            print(f"  ❌ FAILED: {result.error_message}")
+        print()
+    
+    failed = [query for query, result in zip(test_queries, results) if not result.success]
+    assert not failed, f"Pattern-matched queries failed to translate: {failed}"
+    
+    # Test difficulty analysis
+    print("🎯 Testing difficulty analysis...")
+    for query in test_queries[:2]:
+        analysis = translator.analyze_query_difficulty(query)
+        print(f"'{query}' -> Difficulty: {analysis['difficulty']} (score: {analysis['complexity_score']:.2f})")
+    
+    print("\n🎉 Natural language translation test completed!")
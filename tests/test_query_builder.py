@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+"""Test logic group WHERE clauses and the prebuilt templates"""
+
+from sqlalchemy import column
+
+from footballviz.query_builder import (
+    FilterCondition, FilterOperator, LogicGroup, LogicOperator, PrebuiltTemplates
+)
+
+COLUMNS = {name: column(name) for name in ('down', 'distance', 'formation', 'yards_gained')}
+
+def _sql(group):
+    clause = group.build_clause(COLUMNS)
+    return str(clause.compile(compile_kwargs={'literal_binds': True}))
+
+def test_where_clause_flattens_and_reflects_edits():
+    group = LogicGroup()
+    group.add_filter('down', FilterOperator.EQUALS, 3)
+    formations = LogicGroup(LogicOperator.OR)
+    formations.add_filter('formation', FilterOperator.IN, ['Shotgun'])
+    formations.add_filter('formation', FilterOperator.EQUALS, 'Pistol')
+    group.add_condition(formations)
+    assert _sql(group) == "down = 3 AND (formation IN ('Shotgun') OR formation = 'Pistol')"
+    
+    # Direct edits that bypass add_condition/add_filter
+    group.conditions.append(FilterCondition('distance', FilterOperator.LESS_THAN_OR_EQUAL, 2))
+    group.conditions[0].value = 4
+    formations.conditions[0].value.append('Singleback')
+    assert _sql(group) == (
+        "down = 4 AND (formation IN ('Shotgun', 'Singleback') OR formation = 'Pistol') AND distance <= 2"
+    )
+    
+    # Edits to a nested group spliced into its same-operator parent
+    nested = LogicGroup()
+    group.add_condition(nested)
+    nested.add_filter('yards_gained', FilterOperator.GREATER_THAN, 5)
+    assert _sql(group).endswith("AND distance <= 2 AND yards_gained > 5")
+    assert group.conditions[-1] is nested
+    
+    group.conditions = group.conditions[:1]
+    assert _sql(group) == "down = 4"
+
+def test_prebuilt_templates_are_built_per_caller():
+    template = PrebuiltTemplates.short_yardage()
+    template.tags.append('edited')
+    template.filter_group.add_filter('down', FilterOperator.EQUALS, 1)
+    template.filter_group.conditions[0].value = 5
+    
+    fresh = PrebuiltTemplates.get_all_templates()[3]
+    assert fresh is not template
+    assert fresh.tags == ['short-yardage', 'power-football', 'critical-downs']
+    assert _sql(fresh.filter_group) == "distance <= 2 AND (down = 3 OR down = 4)"
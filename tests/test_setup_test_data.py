@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+"""Test that setup_test_data's DIRECT_DB mode inserts the test team"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+TEST_TEAM = {
+    'team_name': 'Test Eagles',
+    'email': 'test@eagles.com',
+    'password': 'password123'
+}
+
+def test_create_team_directly(tmp_path, monkeypatch):
+    """The team row is inserted once, with a hash the login endpoint accepts"""
+    pytest.importorskip("bcrypt")
+    # main binds its database when first imported; a cached import would write to the real one
+    assert 'main' not in sys.modules, "main was imported before DATABASE_URL could be redirected"
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'test.db'}")
+    monkeypatch.setenv("SECRET_KEY", "test")
+    monkeypatch.setenv("JWT_SECRET_KEY", "test")
+    main = pytest.importorskip("main")
+    from setup_test_data import create_team_directly
+    
+    with main.app.app_context():
+        main.db.create_all()
+    
+    assert create_team_directly(TEST_TEAM)
+    assert not create_team_directly(TEST_TEAM)
+    
+    with main.app.app_context():
+        team = main.Team.query.filter_by(email=TEST_TEAM['email']).one()
+        assert team.team_name == TEST_TEAM['team_name']
+        assert main.bcrypt.check_password_hash(team.password_hash, TEST_TEAM['password'])